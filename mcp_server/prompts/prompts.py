@@ -15,15 +15,43 @@
 
 """Prompts for the DCI MCP server."""
 
+import asyncio
 import fnmatch
 import logging
-from datetime import UTC
-from typing import Annotated
+import re
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
+from typing import Annotated, Any
+
+from cachetools import TLRUCache
+from dciclient.v1.api import job as job_api
 
 from ..services.dci_job_service import DCIJobService
 
 logger = logging.getLogger(__name__)
 
+# Files left out of the RCA prompt. The skip patterns are compiled into a
+# single regex so that each file name is matched once, not once per pattern.
+_SKIP_MIME_TYPES = frozenset({"application/x-ansible-output"})
+_SKIP_FILE_RE = re.compile(
+    "|".join(
+        fnmatch.translate(pattern)
+        for pattern in (
+            "failed_task.txt",
+            "play_recap",
+            "task_*",
+            "hardware.*",
+            "kernel.*",
+        )
+    )
+)
+
+# Job IDs are UUIDs. The ID is interpolated into an ES search query, so
+# anything that could end the quoted value is rejected up front.
+_JOB_ID_RE = re.compile(r"[\w-]+")
+
 # Shared RCA methodology text (Steps 2-4) used by both the static
 # fallback prompt and the dynamic prompt to avoid duplication.
 _RCA_METHODOLOGY = """## Step 2: Root Cause Analysis using the 5 Whys Method
@@ -100,16 +128,48 @@ Structure the report with these sections:
 """
 
 
+# Jobs in these states no longer change, so their metadata is kept for an
+# hour; running jobs are only cached briefly so status changes show up.
+_TERMINAL_JOB_STATUSES = frozenset({"success", "failure", "error", "killed"})
+
+
+def _job_metadata_ttu(_job_id: str, metadata: dict, now: float) -> float:
+    """Return the expiration time of a cached job metadata entry."""
+    if metadata.get("status") in _TERMINAL_JOB_STATUSES:
+        return now + 3600
+    return now + 15
+
+
+_job_metadata_cache: TLRUCache = TLRUCache(maxsize=1024, ttu=_job_metadata_ttu)
+_job_metadata_lock = threading.Lock()
+
+
 def _fetch_job_metadata(job_id: str) -> dict | None:
     """Fetch job metadata (tags, components, pipeline, status_reason).
 
     Uses the DCI ES search API to retrieve a single job by ID with only
-    the fields needed for dynamic prompt generation.
+    the fields needed for dynamic prompt generation.  Successful lookups
+    are cached for 15 seconds, or one hour once the job has finished.
 
     Returns:
         A dict with keys: tags, components, pipeline_name, status_reason,
         status, topic_name.  Returns None on any failure.
     """
+    with _job_metadata_lock:
+        metadata = _job_metadata_cache.get(job_id)
+    if metadata is None:
+        metadata = _search_job_metadata(job_id)
+        if metadata is not None:
+            with _job_metadata_lock:
+                _job_metadata_cache[job_id] = metadata
+    return metadata
+
+
+def _search_job_metadata(job_id: str) -> dict | None:
+    """Search the metadata of a single job, see ``_fetch_job_metadata``."""
+    if not _JOB_ID_RE.fullmatch(job_id):
+        logger.debug("Invalid job ID %r, not searching its metadata", job_id)
+        return None
     try:
         service = DCIJobService()
         result = service.search_jobs(
@@ -136,6 +196,46 @@ def _fetch_job_metadata(job_id: str) -> dict | None:
         return None
 
 
+def _iter_job_file_pages(
+    service: DCIJobService, job_id: str, limit: int = 200
+) -> Iterator[list[dict]]:
+    """Yield the pages of files attached to a job, in offset order.
+
+    When the first page reports the total count in ``_meta``, the pages
+    up to that count are fetched concurrently (up to 8 at a time). The
+    count is only an estimate, since files can be added meanwhile: pages
+    are then fetched one after the other until a short or empty page
+    comes back.
+    """
+
+    def fetch_page(offset: int) -> tuple[list[dict], Any]:
+        # Pages may be fetched from pool threads: use that thread's context
+        context = service._get_dci_context()
+        response = job_api.list_files(context, job_id, limit=limit, offset=offset)
+        data = response.json()
+        if not isinstance(data, dict):
+            return [], None
+        return data.get("files", []), (data.get("_meta") or {}).get("count")
+
+    files_page, count = fetch_page(0)
+    yield files_page
+    if len(files_page) < limit:
+        return
+
+    offset = limit
+    if isinstance(count, int) and count > limit:
+        offsets = range(limit, count, limit)
+        with ThreadPoolExecutor(max_workers=min(len(offsets), 8)) as executor:
+            for files_page, _ in executor.map(fetch_page, offsets):
+                yield files_page
+        offset = offsets[-1] + limit
+
+    while len(files_page) == limit:
+        files_page, _ = fetch_page(offset)
+        yield files_page
+        offset += limit
+
+
 def _fetch_job_files(job_id: str) -> list[dict] | None:
     """Fetch the list of files attached to a job.
 
@@ -145,29 +245,14 @@ def _fetch_job_files(job_id: str) -> list[dict] | None:
     *API failure*.
 
     Paginates through the API (default page size is 20) to retrieve all
-    files.
+    files.  Each page is reduced to the few fields the prompt needs as it
+    arrives, so the full API records are never all held in memory.
 
     Returns:
         A list of dicts with keys id, name, size.  Returns None on failure.
     """
     try:
-        from dciclient.v1.api import job as job_api
-
         service = DCIJobService()
-        context = service._get_dci_context()
-
-        all_files: list[dict] = []
-        limit = 200
-        offset = 0
-
-        while True:
-            response = job_api.list_files(context, job_id, limit=limit, offset=offset)
-            data = response.json()
-            files_page = data.get("files", []) if isinstance(data, dict) else []
-            all_files.extend(files_page)
-            if len(files_page) < limit:
-                break
-            offset += limit
 
         return [
             {
@@ -176,7 +261,8 @@ def _fetch_job_files(job_id: str) -> list[dict] | None:
                 "size": f.get("size", 0),
                 "mime": f.get("mime", ""),
             }
-            for f in all_files
+            for files_page in _iter_job_file_pages(service, job_id)
+            for f in files_page
         ]
     except Exception:
         logger.debug("Failed to fetch files for job %s", job_id, exc_info=True)
@@ -227,14 +313,6 @@ def _prioritize_files(
 
     Files matching skip patterns or MIME-based skips are excluded entirely.
     """
-    skip_mime_types = {"application/x-ansible-output"}
-    skip_patterns = [
-        "failed_task.txt",
-        "play_recap",
-        "task_*",
-        "hardware.*",
-        "kernel.*",
-    ]
     buckets: dict[str, list[dict]] = {
         "P1": [],
         "P2": [],
@@ -252,26 +330,26 @@ def _prioritize_files(
         mime = f.get("mime", "")
         if f.get("size", 0) == 0:
             continue
-        if mime in skip_mime_types:
+        if mime in _SKIP_MIME_TYPES:
             continue
-        if any(fnmatch.fnmatch(name, pat) for pat in skip_patterns):
+        if _SKIP_FILE_RE.match(name):
             continue
 
         if name == "ansible.log":
             buckets["P1"].append(f)
-        elif fnmatch.fnmatch(name, "logjuicer_omg*"):
+        elif name.startswith("logjuicer_omg"):
             buckets["P3"].append(f)
-        elif fnmatch.fnmatch(name, "logjuicer*"):
+        elif name.startswith("logjuicer"):
             buckets["P2"].append(f)
         elif mime == "application/junit":
             buckets["P4"].append(f)
-        elif fnmatch.fnmatch(name, "*must_gather*"):
+        elif "must_gather" in name:
             buckets["P5"].append(f)
-        elif fnmatch.fnmatch(name, "*events.txt"):
+        elif name.endswith("events.txt"):
             buckets["P6"].append(f)
-        elif fnmatch.fnmatch(name, "*-console.log"):
+        elif name.endswith("-console.log"):
             buckets["P6b"].append(f)
-        elif fnmatch.fnmatch(name, "*.log"):
+        elif name.endswith(".log"):
             buckets["P7"].append(f)
         else:
             buckets["P8"].append(f)
@@ -575,8 +653,12 @@ def register_prompts(mcp):
             A prompt message with instructions on how to perform RCA of a failing DCI job.
         """
         # -- Pre-fetch job metadata and files ----------------------------------
-        metadata = _fetch_job_metadata(dci_job_id)
-        files = _fetch_job_files(dci_job_id)
+        # Both are independent blocking API calls: run them concurrently in
+        # worker threads instead of one after the other on the event loop.
+        metadata, files = await asyncio.gather(
+            asyncio.to_thread(_fetch_job_metadata, dci_job_id),
+            asyncio.to_thread(_fetch_job_files, dci_job_id),
+        )
 
         # If both fetches fail, fall back to the static prompt so the agent
         # can still do its job (just without the dynamic file list).
@@ -900,8 +982,6 @@ Alternatively, manually create the report with the following structure:
         Returns:
             A prompt message with instructions on how to generate a support case report.
         """
-        from datetime import datetime
-
         today = datetime.now(UTC).strftime("%Y-%m-%d")
 
         return f"""Generate a comprehensive support case report for Red Hat support case **{case_number}**.
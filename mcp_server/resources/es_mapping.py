@@ -16,10 +16,27 @@
 """MCP resources for ElasticSearch mapping."""
 
 import json
+from functools import lru_cache
 from pathlib import Path
 
 from fastmcp import FastMCP
 
+from ..utils.json_utils import dumps, error_response
+
+_MAPPING_PATH = Path(__file__).parent.parent.parent / "ES_mapping" / "mapping.json"
+
+
+@lru_cache(maxsize=1)
+def load_es_mapping() -> str:
+    """Load and serialize the ElasticSearch mapping.
+
+    The mapping file ships with the server and does not change while it
+    runs, so it is read and serialized once. Failures raise and are not
+    cached.
+    """
+    with open(_MAPPING_PATH) as f:
+        return dumps(json.load(f))
+
 
 def register_es_mapping_resource(mcp: FastMCP) -> None:
     """Register ElasticSearch mapping as an MCP resource."""
@@ -35,19 +52,10 @@ def register_es_mapping_resource(mcp: FastMCP) -> None:
 
         The mapping is in ElasticSearch 7.16 format.
         """
-        # Get the path to the ES mapping file
-        mapping_path = (
-            Path(__file__).parent.parent.parent / "ES_mapping" / "mapping.json"
-        )
-
-        if not mapping_path.exists():
-            return json.dumps({"error": "ES mapping file not found"}, indent=2)
+        if not _MAPPING_PATH.exists():
+            return error_response("ES mapping file not found")
 
         try:
-            with open(mapping_path) as f:
-                mapping_data = json.load(f)
-            return json.dumps(mapping_data, indent=2)
+            return load_es_mapping()
         except Exception as e:
-            return json.dumps(
-                {"error": f"Failed to load ES mapping: {str(e)}"}, indent=2
-            )
+            return error_response(f"Failed to load ES mapping: {str(e)}")
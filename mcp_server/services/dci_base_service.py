@@ -1,6 +1,7 @@
 """Base DCI service for common authentication and context management."""
 
 import os
+import threading
 from typing import Any
 
 from dciclient.v1.api.context import build_dci_context, build_signature_context
@@ -9,8 +10,25 @@ from dciclient.v1.api.context import build_dci_context, build_signature_context
 class DCIBaseService:
     """Base service class for DCI API interactions."""
 
+    def __init__(self) -> None:
+        """Initialize the per-thread DCI context storage."""
+        self._local = threading.local()
+
     def _get_dci_context(self) -> Any:
-        """Get DCI context for API calls."""
+        """Get DCI context for API calls.
+
+        A context wraps a ``requests.Session``, which is not documented as
+        thread-safe, and services are called from worker threads. Each
+        thread therefore builds its own context on first use and reuses it,
+        along with the connections its session pools, afterwards.
+        """
+        context = getattr(self._local, "context", None)
+        if context is None:
+            context = self._local.context = self._build_dci_context()
+        return context
+
+    def _build_dci_context(self) -> Any:
+        """Build a new DCI context from the environment credentials."""
 
         if "DCI_CLIENT_ID" in os.environ and "DCI_API_SECRET" in os.environ:
             return build_signature_context(
@@ -21,6 +21,7 @@ from pathlib import Path
 from typing import Any
 
 from dciclient.v1.api import file as dci_file
+from dciclient.v1.api import job
 
 from .dci_base_service import DCIBaseService
 
@@ -71,8 +72,6 @@ class DCIFileService(DCIBaseService):
         """
         try:
             context = self._get_dci_context()
-            from dciclient.v1.api import job
-
             result = job.list_files(context, job_id)
 
             # Check if the result has a json method
@@ -2,7 +2,7 @@
 
 import os
 import sys
-from datetime import UTC
+from datetime import UTC, datetime
 from typing import Any
 
 from github import Auth, Github
@@ -338,8 +338,6 @@ class GitHubService:
             remaining = e.headers.get("x-ratelimit-remaining", "0")
             limit = e.headers.get("x-ratelimit-limit", "unknown")
             if reset_ts:
-                from datetime import datetime
-
                 reset_dt = datetime.fromtimestamp(int(reset_ts), tz=UTC)
                 reset_info = (
                     f" Rate limit resets at {reset_dt.isoformat()} UTC."
@@ -2,10 +2,13 @@
 
 import os
 import sys
+import threading
 from typing import Any
 
+from cachetools import TTLCache
 from jira import JIRA
 from jira.exceptions import JIRAError
+from requests.adapters import HTTPAdapter
 
 
 def _simplify_field_value(value: Any) -> Any:
@@ -53,10 +56,19 @@ class JiraService:
             )
         else:
             self.jira = JIRA(server=self.jira_url, token_auth=self.jira_token)
+        # Keep more connections alive for concurrent tool calls; retries are
+        # left to the jira client's ResilientSession.
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+        self.jira._session.mount("https://", adapter)
+        self.jira._session.mount("http://", adapter)
         self._field_map: dict[str, str] | None = None
         self._user_field_ids: set[str] | None = None
         self._multi_user_field_ids: set[str] | None = None
         self._status_name_map: dict[str, str] | None = None
+        # Assignee name -> Jira Cloud account ID. Bounded, and expired after
+        # an hour since accounts can be deactivated or replaced.
+        self._account_ids: TTLCache = TTLCache(maxsize=256, ttl=3600)
+        self._account_ids_lock = threading.Lock()
         self._is_cloud = "atlassian.net" in self.jira_url
 
     def _resolve_assignee(self, assignee: str) -> dict[str, str] | None:
@@ -71,11 +83,18 @@ class JiraService:
         if not self._is_cloud:
             return {"name": assignee}
 
+        with self._account_ids_lock:
+            account_id = self._account_ids.get(assignee)
+        if account_id is not None:
+            return {"accountId": account_id}
+
         users = self.jira._session.get(
             f"{self.jira_url}/rest/api/2/user/search",
             params={"query": assignee, "maxResults": 1},
         ).json()
         if users:
+            with self._account_ids_lock:
+                self._account_ids[assignee] = users[0]["accountId"]
             return {"accountId": users[0]["accountId"]}
 
         raise ValueError(
@@ -183,27 +202,29 @@ class JiraService:
 
         Also populates ``_user_field_ids`` and ``_multi_user_field_ids``
         so that ``update_issue`` can resolve user-type custom fields.
+        A failed lookup returns an empty map and is retried on next use.
         """
         if self._field_map is None:
             try:
                 fields = self.jira.fields()
-                self._field_map = {}
-                user_ids: set[str] = set()
-                multi_user_ids: set[str] = set()
-                for f in fields:
-                    self._field_map[f["id"]] = f["name"]
-                    schema = f.get("schema", {})
-                    custom = schema.get("custom", "")
-                    if schema.get("type") == "user" or custom.endswith(":userpicker"):
-                        user_ids.add(f["id"])
-                    elif custom.endswith(":multiuserpicker"):
-                        multi_user_ids.add(f["id"])
-                self._user_field_ids = user_ids
-                self._multi_user_field_ids = multi_user_ids
             except Exception:
-                self._field_map = {}
                 self._user_field_ids = set()
                 self._multi_user_field_ids = set()
+                return {}
+            field_map: dict[str, str] = {}
+            user_ids: set[str] = set()
+            multi_user_ids: set[str] = set()
+            for f in fields:
+                field_map[f["id"]] = f["name"]
+                schema = f.get("schema", {})
+                custom = schema.get("custom", "")
+                if schema.get("type") == "user" or custom.endswith(":userpicker"):
+                    user_ids.add(f["id"])
+                elif custom.endswith(":multiuserpicker"):
+                    multi_user_ids.add(f["id"])
+            self._user_field_ids = user_ids
+            self._multi_user_field_ids = multi_user_ids
+            self._field_map = field_map
         return self._field_map
 
     def get_ticket_data(
@@ -493,7 +514,7 @@ class JiraService:
 
         The v2 API (used by the jira library) returns localised status names.
         The v3 API includes ``untranslatedName`` which is always English.
-        Result is cached per instance.
+        Result is cached per instance; a failed lookup is retried on next use.
         """
         if self._status_name_map is not None:
             return self._status_name_map
@@ -503,7 +524,7 @@ class JiraService:
                 s["id"]: s.get("untranslatedName") or s["name"] for s in resp.json()
             }
         except Exception:
-            self._status_name_map = {}
+            return {}
         return self._status_name_map
 
     def _status_name(self, status_obj: Any) -> str:
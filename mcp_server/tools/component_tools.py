@@ -1,12 +1,20 @@
 """MCP tools for DCI component operations."""
 
-import json
+import asyncio
 from typing import Annotated
 
 from fastmcp import FastMCP
 from pydantic import Field
 
 from ..services.dci_component_service import DCIComponentService
+from ..utils.json_utils import dumps_async, error_response
+from ..utils.service_utils import shared_service
+
+
+@shared_service
+def get_component_service() -> DCIComponentService:
+    """Get the shared DCI component service, creating it on first use."""
+    return DCIComponentService()
 
 
 def register_component_tools(mcp: FastMCP) -> None:
@@ -31,11 +39,11 @@ def register_component_tools(mcp: FastMCP) -> None:
         ] = 20,
         offset: Annotated[int, Field(description="Offset for pagination", ge=0)] = 0,
         fields: Annotated[
-            list[str],
+            list[str] | None,
             Field(
-                description="List of fields to return. Fields are the one listed in the query description and responses. Must be specified as a list of strings. If empty, no fields are returned.",
+                description="List of fields to return. Fields are the one listed in the query description and responses. Must be specified as a list of strings. If empty or omitted, no fields are returned.",
             ),
-        ] = [],
+        ] = None,
     ) -> str:
         """
         Lookup DCI components with an advanced query language.
@@ -110,23 +118,31 @@ def register_component_tools(mcp: FastMCP) -> None:
             JSON string with list of components and pagination info
         """
         try:
-            service = DCIComponentService()
-
-            result = service.query_components(
-                query=query, sort=sort, limit=limit, offset=offset
+            service = get_component_service()
+
+            # Without fields no record is returned, only _meta.count: a
+            # single row is enough to get it.
+            if not fields:
+                limit = 1
+
+            result = await asyncio.to_thread(
+                service.query_components,
+                query=query,
+                sort=sort,
+                limit=limit,
+                offset=offset,
             )
 
-            if isinstance(fields, list) and fields:
-                # Filter the result to only include specified fields
-                if "components" in result:
-                    filtered_result = [
+            if "components" in result:
+                if fields:
+                    # Keep only the requested fields
+                    result["components"] = [
                         {field: component.get(field) for field in fields}
                         for component in result["components"]
                     ]
-                    result["components"] = filtered_result
-            elif not fields:
-                result["components"] = []
+                else:
+                    result["components"] = []
 
-            return json.dumps(result, indent=2)
+            return await dumps_async(result)
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
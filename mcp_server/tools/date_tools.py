@@ -16,10 +16,11 @@
 """Date tools for FastMCP server."""
 
 import datetime
-import json
 
 from fastmcp import FastMCP
 
+from ..utils.json_utils import dumps
+
 
 def register_date_tools(mcp: FastMCP) -> None:
     """Register date related tools with the MCP server."""
@@ -34,7 +35,7 @@ def register_date_tools(mcp: FastMCP) -> None:
         """
         # make sure the date is on the GMT timezone as DCI works in GMT
         today_date = datetime.datetime.now(datetime.UTC).date().isoformat()
-        return json.dumps({"today": today_date}, indent=2)
+        return dumps({"today": today_date})
 
     @mcp.tool()
     async def now() -> str:
@@ -48,7 +49,7 @@ def register_date_tools(mcp: FastMCP) -> None:
         current_time = datetime.datetime.now(datetime.UTC).strftime(
             "%Y-%m-%dT%H:%M:%S.%f"
         )
-        return json.dumps({"now": current_time}, indent=2)
+        return dumps({"now": current_time})
 
 
 # date_tools.py ends here
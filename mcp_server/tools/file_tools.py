@@ -15,13 +15,21 @@
 
 """MCP tools for DCI file operations."""
 
-import json
+import asyncio
 from typing import Annotated
 
 from fastmcp import FastMCP
 from pydantic import Field
 
 from ..services.dci_file_service import DCIFileService
+from ..utils.json_utils import dumps
+from ..utils.service_utils import shared_service
+
+
+@shared_service
+def get_file_service() -> DCIFileService:
+    """Get the shared DCI file service, creating it on first use."""
+    return DCIFileService()
 
 
 def register_file_tools(mcp: FastMCP) -> None:
@@ -47,20 +55,18 @@ def register_file_tools(mcp: FastMCP) -> None:
             JSON string with download status
         """
         try:
-            service = DCIFileService()
-            resolved_path = service.download_file(job_id, file_id, output_path)
+            service = get_file_service()
+            resolved_path = await asyncio.to_thread(
+                service.download_file, job_id, file_id, output_path
+            )
 
-            return json.dumps(
+            return dumps(
                 {
                     "success": True,
                     "file_id": file_id,
                     "output_path": resolved_path,
                     "message": f"File downloaded successfully to {resolved_path}",
-                },
-                indent=2,
+                }
             )
         except Exception as e:
-            return json.dumps(
-                {"success": False, "file_id": file_id, "error": str(e)},
-                indent=2,
-            )
+            return dumps({"success": False, "file_id": file_id, "error": str(e)})
@@ -1,6 +1,6 @@
 """MCP tools for GitHub issue and pull request operations."""
 
-import json
+import asyncio
 import re
 from typing import Annotated
 
@@ -8,6 +8,20 @@ from fastmcp import FastMCP
 from pydantic import Field
 
 from ..services.github_service import GitHubService
+from ..utils.json_utils import dumps, error_response
+from ..utils.service_utils import shared_service
+
+# Pattern to match owner/repo format
+_REPO_NAME_RE = re.compile(r"^[a-zA-Z0-9._-]+/[a-zA-Z0-9._-]+$")
+
+
+@shared_service
+def get_github_service() -> GitHubService:
+    """Get the shared GitHub service, creating it on first use.
+
+    Reusing the client keeps its HTTP connections open between tool calls.
+    """
+    return GitHubService()
 
 
 def validate_repo_name(repo_name: str) -> str:
@@ -26,10 +40,7 @@ def validate_repo_name(repo_name: str) -> str:
     # Remove any whitespace
     repo_name = repo_name.strip()
 
-    # Pattern to match owner/repo format
-    pattern = r"^[a-zA-Z0-9._-]+/[a-zA-Z0-9._-]+$"
-
-    if not re.match(pattern, repo_name):
+    if not _REPO_NAME_RE.match(repo_name):
         raise ValueError(
             f"Invalid repository name format: '{repo_name}'. "
             "Expected format: owner/repo (e.g., octocat/Hello-World)"
@@ -158,16 +169,17 @@ def register_github_tools(mcp: FastMCP) -> None:
             JSON string with total_count and items array
         """
         try:
-            # Initialize GitHub service
-            github_service = GitHubService()
+            github_service = get_github_service()
 
             # Search issues
-            results = github_service.search_issues(query, max_results, offset)
+            results = await asyncio.to_thread(
+                github_service.search_issues, query, max_results, offset
+            )
 
-            return json.dumps(results, indent=2)
+            return dumps(results)
 
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
 
     @mcp.tool()
     async def get_github_issue(
@@ -254,20 +266,23 @@ def register_github_tools(mcp: FastMCP) -> None:
             # Validate and normalize repository name
             normalized_repo = validate_repo_name(repo)
 
-            # Initialize GitHub service
-            github_service = GitHubService()
+            github_service = get_github_service()
 
             # Get issue/PR data
-            issue_data = github_service.get_issue(
-                normalized_repo, issue_number, max_comments, comment_offset
+            issue_data = await asyncio.to_thread(
+                github_service.get_issue,
+                normalized_repo,
+                issue_number,
+                max_comments,
+                comment_offset,
             )
 
-            return json.dumps(issue_data, indent=2)
+            return dumps(issue_data)
 
         except ValueError as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
 
     @mcp.tool()
     async def get_github_repository_info(
@@ -319,18 +334,19 @@ def register_github_tools(mcp: FastMCP) -> None:
             # Validate and normalize repository name
             normalized_repo = validate_repo_name(repo)
 
-            # Initialize GitHub service
-            github_service = GitHubService()
+            github_service = get_github_service()
 
             # Get repository info
-            repo_info = github_service.get_repository_info(normalized_repo)
+            repo_info = await asyncio.to_thread(
+                github_service.get_repository_info, normalized_repo
+            )
 
-            return json.dumps(repo_info, indent=2)
+            return dumps(repo_info)
 
         except ValueError as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
 
     @mcp.tool()
     async def get_github_rate_limit() -> str:
@@ -358,11 +374,11 @@ def register_github_tools(mcp: FastMCP) -> None:
             JSON string with rate limit status
         """
         try:
-            github_service = GitHubService()
-            status = github_service.get_rate_limit_status()
-            return json.dumps(status, indent=2)
+            github_service = get_github_service()
+            status = await asyncio.to_thread(github_service.get_rate_limit_status)
+            return dumps(status)
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
 
     @mcp.tool()
     async def get_github_pr_diff(
@@ -449,16 +465,20 @@ def register_github_tools(mcp: FastMCP) -> None:
         """
         try:
             normalized_repo = validate_repo_name(repo)
-            github_service = GitHubService()
-            pr_diff = github_service.get_pr_diff(
-                normalized_repo, pull_number, max_files, offset
+            github_service = get_github_service()
+            pr_diff = await asyncio.to_thread(
+                github_service.get_pr_diff,
+                normalized_repo,
+                pull_number,
+                max_files,
+                offset,
             )
-            return json.dumps(pr_diff, indent=2)
+            return dumps(pr_diff)
 
         except ValueError as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
 
     @mcp.tool()
     async def get_github_pr_checks(
@@ -525,11 +545,13 @@ def register_github_tools(mcp: FastMCP) -> None:
         """
         try:
             normalized_repo = validate_repo_name(repo)
-            github_service = GitHubService()
-            pr_checks = github_service.get_pr_checks(normalized_repo, pull_number)
-            return json.dumps(pr_checks, indent=2)
+            github_service = get_github_service()
+            pr_checks = await asyncio.to_thread(
+                github_service.get_pr_checks, normalized_repo, pull_number
+            )
+            return dumps(pr_checks)
 
         except ValueError as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
@@ -1,6 +1,6 @@
 """MCP tools for GitLab project, issue, and merge request operations."""
 
-import json
+import asyncio
 import re
 from typing import Annotated
 
@@ -8,6 +8,10 @@ from fastmcp import FastMCP
 from pydantic import Field
 
 from ..services.gitlab_service import GitLabService
+from ..utils.json_utils import dumps, error_response
+
+# Pattern to match group/project paths, with any number of subgroups
+_PROJECT_PATH_RE = re.compile(r"^[a-zA-Z0-9._-]+(/[a-zA-Z0-9._-]+)+$")
 
 
 def validate_project_path(project_path: str) -> str:
@@ -28,9 +32,7 @@ def validate_project_path(project_path: str) -> str:
     if project_path.isdigit():
         return project_path
 
-    pattern = r"^[a-zA-Z0-9._-]+(/[a-zA-Z0-9._-]+)+$"
-
-    if not re.match(pattern, project_path):
+    if not _PROJECT_PATH_RE.match(project_path):
         raise ValueError(
             f"Invalid project path format: '{project_path}'. "
             "Expected format: group/project (e.g., gitlab-org/gitlab) "
@@ -151,7 +153,8 @@ def register_gitlab_tools(mcp: FastMCP) -> None:
                 else None
             )
 
-            results = gitlab_service.search_issues(
+            results = await asyncio.to_thread(
+                gitlab_service.search_issues,
                 normalized_project,
                 search,
                 state,
@@ -160,12 +163,12 @@ def register_gitlab_tools(mcp: FastMCP) -> None:
                 offset,
             )
 
-            return json.dumps(results, indent=2)
+            return dumps(results)
 
         except ValueError as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
 
     @mcp.tool()
     async def get_gitlab_issue(
@@ -258,16 +261,20 @@ def register_gitlab_tools(mcp: FastMCP) -> None:
             normalized_project = validate_project_path(project)
             gitlab_service = GitLabService(gitlab_url=gitlab_url)
 
-            issue_data = gitlab_service.get_issue(
-                normalized_project, issue_iid, max_notes, note_offset
+            issue_data = await asyncio.to_thread(
+                gitlab_service.get_issue,
+                normalized_project,
+                issue_iid,
+                max_notes,
+                note_offset,
             )
 
-            return json.dumps(issue_data, indent=2)
+            return dumps(issue_data)
 
         except ValueError as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
 
     @mcp.tool()
     async def search_gitlab_merge_requests(
@@ -377,7 +384,8 @@ def register_gitlab_tools(mcp: FastMCP) -> None:
                 else None
             )
 
-            results = gitlab_service.search_merge_requests(
+            results = await asyncio.to_thread(
+                gitlab_service.search_merge_requests,
                 normalized_project,
                 search,
                 state,
@@ -386,12 +394,12 @@ def register_gitlab_tools(mcp: FastMCP) -> None:
                 offset,
             )
 
-            return json.dumps(results, indent=2)
+            return dumps(results)
 
         except ValueError as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
 
     @mcp.tool()
     async def get_gitlab_mr_diff(
@@ -489,19 +497,20 @@ def register_gitlab_tools(mcp: FastMCP) -> None:
         try:
             normalized_project = validate_project_path(project)
             gitlab_service = GitLabService(gitlab_url=gitlab_url)
-            mr_diff = gitlab_service.get_mr_diff(
+            mr_diff = await asyncio.to_thread(
+                gitlab_service.get_mr_diff,
                 normalized_project,
                 mr_iid,
                 max_files,
                 offset,
                 context_lines=context_lines,
             )
-            return json.dumps(mr_diff, indent=2)
+            return dumps(mr_diff)
 
         except ValueError as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
 
     @mcp.tool()
     async def get_gitlab_project_info(
@@ -560,10 +569,12 @@ def register_gitlab_tools(mcp: FastMCP) -> None:
         try:
             normalized_project = validate_project_path(project)
             gitlab_service = GitLabService(gitlab_url=gitlab_url)
-            project_info = gitlab_service.get_project_info(normalized_project)
-            return json.dumps(project_info, indent=2)
+            project_info = await asyncio.to_thread(
+                gitlab_service.get_project_info, normalized_project
+            )
+            return dumps(project_info)
 
         except ValueError as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
@@ -1,12 +1,24 @@
 """MCP tools for Google Drive operations."""
 
-import json
+import asyncio
 from typing import Annotated
 
 from fastmcp import FastMCP
 from pydantic import Field
 
 from ..services.google_drive_service import GoogleDriveService
+from ..utils.json_utils import dumps, error_response
+from ..utils.service_utils import shared_service
+
+
+@shared_service
+def get_google_drive_service() -> GoogleDriveService:
+    """Get the shared Google Drive service, creating it on first use.
+
+    Authenticating reads the OAuth token and may refresh it, so it is done
+    once rather than on every tool call.
+    """
+    return GoogleDriveService()
 
 
 def register_google_drive_tools(mcp: FastMCP) -> None:
@@ -50,13 +62,17 @@ def register_google_drive_tools(mcp: FastMCP) -> None:
             JSON string with the created document information including ID and URL
         """
         try:
-            service = GoogleDriveService()
-            result = service.create_google_doc_from_markdown(
-                markdown_content, doc_title, folder_id, folder_name
+            service = get_google_drive_service()
+            result = await asyncio.to_thread(
+                service.create_google_doc_from_markdown,
+                markdown_content,
+                doc_title,
+                folder_id,
+                folder_name,
             )
-            return json.dumps(result, indent=2)
+            return dumps(result)
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
 
     @mcp.tool()
     async def create_google_doc_from_file(
@@ -97,13 +113,17 @@ def register_google_drive_tools(mcp: FastMCP) -> None:
             JSON string with the created document information including ID and URL
         """
         try:
-            service = GoogleDriveService()
-            result = service.create_google_doc_from_file(
-                file_path, doc_title, folder_id, folder_name
+            service = get_google_drive_service()
+            result = await asyncio.to_thread(
+                service.create_google_doc_from_file,
+                file_path,
+                doc_title,
+                folder_id,
+                folder_name,
             )
-            return json.dumps(result, indent=2)
+            return dumps(result)
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
 
     @mcp.tool()
     async def list_google_docs(
@@ -131,11 +151,11 @@ def register_google_drive_tools(mcp: FastMCP) -> None:
             JSON string with list of document information
         """
         try:
-            service = GoogleDriveService()
-            result = service.list_documents(query, max_results)
-            return json.dumps({"documents": result, "count": len(result)}, indent=2)
+            service = get_google_drive_service()
+            result = await asyncio.to_thread(service.list_documents, query, max_results)
+            return dumps({"documents": result, "count": len(result)})
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
 
     @mcp.tool()
     async def convert_dci_report_to_google_doc(
@@ -176,13 +196,17 @@ def register_google_drive_tools(mcp: FastMCP) -> None:
             JSON string with the created document information including ID and URL
         """
         try:
-            service = GoogleDriveService()
-            result = service.create_google_doc_from_file(
-                report_path, doc_title, folder_id, folder_name
+            service = get_google_drive_service()
+            result = await asyncio.to_thread(
+                service.create_google_doc_from_file,
+                report_path,
+                doc_title,
+                folder_id,
+                folder_name,
             )
-            return json.dumps(result, indent=2)
+            return dumps(result)
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
 
     @mcp.tool()
     async def find_folder_by_name(
@@ -206,25 +230,25 @@ def register_google_drive_tools(mcp: FastMCP) -> None:
             JSON string with folder information including ID and location details
         """
         try:
-            service = GoogleDriveService()
-            folder_id = service.find_folder_by_name(folder_name, include_shared_drives)
+            service = get_google_drive_service()
+            folder_id = await asyncio.to_thread(
+                service.find_folder_by_name, folder_name, include_shared_drives
+            )
 
             if folder_id:
-                return json.dumps(
+                return dumps(
                     {
                         "found": True,
                         "folder_id": folder_id,
                         "message": f"Folder '{folder_name}' found with ID: {folder_id}",
-                    },
-                    indent=2,
+                    }
                 )
             else:
-                return json.dumps(
+                return dumps(
                     {
                         "found": False,
                         "message": f"Folder '{folder_name}' not found in Google Drive{' or shared drives' if include_shared_drives else ''}",
-                    },
-                    indent=2,
+                    }
                 )
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
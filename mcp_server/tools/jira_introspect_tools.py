@@ -1,12 +1,13 @@
 """MCP tools for Jira introspection (filters, components, versions, boards, sprints)."""
 
-import json
+import asyncio
 from typing import Annotated
 
 from fastmcp import FastMCP
 from pydantic import Field
 
-from ..services.jira_service import JiraService
+from ..utils.json_utils import dumps, error_response
+from .jira_tools import get_jira_service
 
 
 def register_jira_introspect_tools(mcp: FastMCP) -> None:
@@ -28,11 +29,11 @@ def register_jira_introspect_tools(mcp: FastMCP) -> None:
             JSON string with filter definition
         """
         try:
-            jira_service = JiraService()
-            result = jira_service.get_filter(filter_id.strip())
-            return json.dumps(result, indent=2)
+            jira_service = get_jira_service()
+            result = await asyncio.to_thread(jira_service.get_filter, filter_id.strip())
+            return dumps(result)
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
 
     @mcp.tool()
     async def list_jira_favourite_filters() -> str:
@@ -45,11 +46,11 @@ def register_jira_introspect_tools(mcp: FastMCP) -> None:
             JSON string with list of favourite filters
         """
         try:
-            jira_service = JiraService()
-            result = jira_service.get_favourite_filters()
-            return json.dumps(result, indent=2)
+            jira_service = get_jira_service()
+            result = await asyncio.to_thread(jira_service.get_favourite_filters)
+            return dumps(result)
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
 
     @mcp.tool()
     async def search_jira_filters(
@@ -69,11 +70,13 @@ def register_jira_introspect_tools(mcp: FastMCP) -> None:
             JSON string with list of matching filters
         """
         try:
-            jira_service = JiraService()
-            result = jira_service.search_filters(filter_name.strip())
-            return json.dumps(result, indent=2)
+            jira_service = get_jira_service()
+            result = await asyncio.to_thread(
+                jira_service.search_filters, filter_name.strip()
+            )
+            return dumps(result)
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
 
     @mcp.tool()
     async def list_jira_project_components(
@@ -92,11 +95,13 @@ def register_jira_introspect_tools(mcp: FastMCP) -> None:
         """
         try:
             project_key = project_key.strip().upper()
-            jira_service = JiraService()
-            result = jira_service.get_project_components(project_key)
-            return json.dumps(result, indent=2)
+            jira_service = get_jira_service()
+            result = await asyncio.to_thread(
+                jira_service.get_project_components, project_key
+            )
+            return dumps(result)
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
 
     @mcp.tool()
     async def list_jira_project_versions(
@@ -115,11 +120,13 @@ def register_jira_introspect_tools(mcp: FastMCP) -> None:
         """
         try:
             project_key = project_key.strip().upper()
-            jira_service = JiraService()
-            result = jira_service.get_project_versions(project_key)
-            return json.dumps(result, indent=2)
+            jira_service = get_jira_service()
+            result = await asyncio.to_thread(
+                jira_service.get_project_versions, project_key
+            )
+            return dumps(result)
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
 
     @mcp.tool()
     async def list_jira_issue_types_for_project(
@@ -138,11 +145,13 @@ def register_jira_introspect_tools(mcp: FastMCP) -> None:
         """
         try:
             project_key = project_key.strip().upper()
-            jira_service = JiraService()
-            result = jira_service.get_issue_types_for_project(project_key)
-            return json.dumps(result, indent=2)
+            jira_service = get_jira_service()
+            result = await asyncio.to_thread(
+                jira_service.get_issue_types_for_project, project_key
+            )
+            return dumps(result)
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
 
     @mcp.tool()
     async def list_jira_issue_link_types() -> str:
@@ -159,11 +168,11 @@ def register_jira_introspect_tools(mcp: FastMCP) -> None:
             JSON string with list of link types
         """
         try:
-            jira_service = JiraService()
-            result = jira_service.get_issue_link_types()
-            return json.dumps(result, indent=2)
+            jira_service = get_jira_service()
+            result = await asyncio.to_thread(jira_service.get_issue_link_types)
+            return dumps(result)
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
 
     @mcp.tool()
     async def list_jira_boards(
@@ -205,17 +214,18 @@ def register_jira_introspect_tools(mcp: FastMCP) -> None:
         """
         try:
             pk = project_key.strip().upper() if project_key else None
-            jira_service = JiraService()
-            result = jira_service.get_boards(
+            jira_service = get_jira_service()
+            result = await asyncio.to_thread(
+                jira_service.get_boards,
                 project_key=pk,
                 board_type=board_type,
                 name=name,
                 max_results=max_results,
                 start_at=offset,
             )
-            return json.dumps(result, indent=2)
+            return dumps(result)
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
 
     @mcp.tool()
     async def list_jira_sprints(
@@ -254,13 +264,14 @@ def register_jira_introspect_tools(mcp: FastMCP) -> None:
             JSON string with total count and list of sprints
         """
         try:
-            jira_service = JiraService()
-            result = jira_service.get_sprints(
+            jira_service = get_jira_service()
+            result = await asyncio.to_thread(
+                jira_service.get_sprints,
                 board_id=board_id,
                 state=state,
                 max_results=max_results,
                 start_at=offset,
             )
-            return json.dumps(result, indent=2)
+            return dumps(result)
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
@@ -1,13 +1,20 @@
 """MCP tools for Jira ticket operations."""
 
-import json
+import asyncio
 import re
-from typing import Annotated
+import threading
+from typing import Annotated, Any
 
+from cachetools import TTLCache, cached
 from fastmcp import FastMCP
 from pydantic import Field
 
 from ..services.jira_service import JiraService
+from ..utils.json_utils import dumps, dumps_async, error_response
+from ..utils.service_utils import shared_service
+
+# Pattern to match PROJECT-NUMBER format, applied to the uppercased key
+_TICKET_KEY_RE = re.compile(r"^[A-Z][A-Z0-9]+-\d+$")
 
 
 def validate_ticket_key(ticket_key: str) -> str:
@@ -26,16 +33,121 @@ def validate_ticket_key(ticket_key: str) -> str:
     # Remove any whitespace
     ticket_key = ticket_key.strip()
 
-    # Pattern to match PROJECT-NUMBER format
-    pattern = r"^[A-Z][A-Z0-9]+-\d+$"
-
-    if not re.match(pattern, ticket_key):
+    # Fast path for well-formed keys using C string predicates; anything
+    # else goes through the regex below for a definitive answer.
+    project, dash, number = ticket_key.partition("-")
+    if (
+        dash
+        and len(project) >= 2
+        and ticket_key.isascii()
+        and project.isalnum()
+        and project[0].isalpha()
+        and number.isdigit()
+    ):
+        return ticket_key.upper()
+
+    # Only ASCII keys are valid. Checking first keeps upper() on its ASCII
+    # fast path, and stops non-ASCII input from passing the pattern after
+    # case mapping ("ı".upper() == "I") or through Unicode digits.
+    normalized_key = ticket_key.upper() if ticket_key.isascii() else ""
+
+    if not _TICKET_KEY_RE.match(normalized_key):
         raise ValueError(
             f"Invalid ticket key format: '{ticket_key}'. "
             "Expected format: PROJECT-NUMBER (e.g., CILAB-1234, OCP-5678)"
         )
 
-    return ticket_key.upper()
+    return normalized_key
+
+
+def normalize_project_key(project_key: str) -> str:
+    """
+    Normalize a Jira project key (strip whitespace, uppercase).
+
+    Keys are usually passed already normalized (e.g., CILAB), in which
+    case they are returned as is without building new strings.
+
+    Args:
+        project_key: Project key (e.g., CILAB, cilab)
+
+    Returns:
+        Normalized project key
+    """
+    if project_key.isascii() and project_key.isalnum() and project_key.isupper():
+        return project_key
+    return project_key.strip().upper()
+
+
+@shared_service
+def get_jira_service() -> JiraService:
+    """
+    Get the shared Jira service, creating it on first use.
+
+    Reusing one service keeps its HTTP session (and pooled connections)
+    and its cached field metadata alive across tool calls.
+
+    Returns:
+        Shared JiraService instance
+
+    Raises:
+        ValueError: If Jira credentials are not configured
+    """
+    return JiraService()
+
+
+# Short-lived cache of ticket lookups; agents often re-read the same ticket
+# several times while triaging a job. Write tools invalidate their entries.
+_ticket_cache: TTLCache = TTLCache(maxsize=512, ttl=120)
+_ticket_cache_lock = threading.Lock()
+
+
+@cached(cache=_ticket_cache, lock=_ticket_cache_lock)
+def get_cached_ticket_data(
+    ticket_key: str, max_comments: int, comment_offset: int
+) -> dict[str, Any]:
+    """
+    Get ticket data through a short-lived (2 minutes) cache.
+
+    Args:
+        ticket_key: Normalized ticket key (e.g., CILAB-1234)
+        max_comments: Maximum number of comments to retrieve
+        comment_offset: Number of comments to skip
+
+    Returns:
+        Dictionary containing ticket data
+    """
+    return get_jira_service().get_ticket_data(ticket_key, max_comments, comment_offset)
+
+
+# Project metadata changes rarely, so it can be kept a bit longer
+_project_cache: TTLCache = TTLCache(maxsize=256, ttl=600)
+_project_cache_lock = threading.Lock()
+
+
+@cached(cache=_project_cache, lock=_project_cache_lock)
+def get_cached_project_info(project_key: str) -> dict[str, Any]:
+    """
+    Get project information through a 10 minute cache.
+
+    Args:
+        project_key: Normalized project key (e.g., CILAB)
+
+    Returns:
+        Dictionary containing project information
+    """
+    return get_jira_service().get_project_info(project_key)
+
+
+def invalidate_ticket_cache(ticket_key: str) -> None:
+    """
+    Drop every cached lookup of a ticket after it has been modified.
+
+    Args:
+        ticket_key: Normalized ticket key (e.g., CILAB-1234)
+    """
+    with _ticket_cache_lock:
+        for key in [key for key in _ticket_cache if key[0] == ticket_key]:
+            _ticket_cache.pop(key, None)
 
 
 def register_jira_tools(mcp: FastMCP) -> None:
@@ -128,20 +240,17 @@ def register_jira_tools(mcp: FastMCP) -> None:
             # Validate and normalize ticket key
             normalized_key = validate_ticket_key(ticket_key)
 
-            # Initialize Jira service
-            jira_service = JiraService()
-
             # Get ticket data
-            ticket_data = jira_service.get_ticket_data(
-                normalized_key, max_comments, comment_offset
+            ticket_data = await asyncio.to_thread(
+                get_cached_ticket_data, normalized_key, max_comments, comment_offset
             )
 
-            return json.dumps(ticket_data, indent=2)
+            return dumps(ticket_data)
 
         except ValueError as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
 
     @mcp.tool()
     async def search_jira_tickets(
@@ -226,15 +335,94 @@ def register_jira_tools(mcp: FastMCP) -> None:
         """
         try:
             # Initialize Jira service
-            jira_service = JiraService()
+            jira_service = get_jira_service()
 
             # Search tickets
-            results = jira_service.search_tickets(jql, max_results, offset)
+            results = await asyncio.to_thread(
+                jira_service.search_tickets, jql, max_results, offset
+            )
+
+            return await dumps_async(results)
+
+        except Exception as e:
+            return error_response(str(e))
+
+    @mcp.tool()
+    async def search_jira_tickets_detailed(
+        jql: Annotated[
+            str,
+            Field(
+                description="JQL (Jira Query Language) query string. Example: 'project = CILAB AND status = Open'"
+            ),
+        ],
+        max_results: Annotated[
+            int,
+            Field(
+                description="Maximum number of tickets to return (default: 10, max: 50)",
+                ge=1,
+                le=50,
+            ),
+        ] = 10,
+        max_comments_each: Annotated[
+            int,
+            Field(
+                description="Maximum number of comments to retrieve per ticket (default: 5, max: 50)",
+                ge=1,
+                le=50,
+            ),
+        ] = 5,
+    ) -> str:
+        """Search Jira tickets using JQL and return full data for each match.
 
-            return json.dumps(results, indent=2)
+        Equivalent to calling `search_jira_tickets` followed by
+        `get_jira_ticket` on every result, in a single call. The tickets
+        are fetched concurrently (at most 8 at a time). Use this when the
+        details of all matching tickets are needed; use
+        `search_jira_tickets` to browse larger result sets.
+
+        ## Authentication Required
+
+        This tool requires Jira API authentication. Set the following environment variables:
+        - `JIRA_API_TOKEN`: Your Jira API token
+        - `JIRA_URL`: Jira server URL (defaults to https://redhat.atlassian.net)
+
+        ## Returned Data
+
+        The tool returns a JSON object containing:
+        - **total_count**: Total number of matching results
+        - **items**: Array of ticket data, in search order, as returned by
+          `get_jira_ticket`. A ticket that could not be fetched is reported
+          as `{"key": ..., "error": ...}`.
+
+        Returns:
+            JSON string with total_count and items array
+        """
+        try:
+            jira_service = get_jira_service()
+            results = await asyncio.to_thread(
+                jira_service.search_tickets, jql, max_results, 0
+            )
+
+            semaphore = asyncio.Semaphore(8)
+
+            async def fetch(key: str) -> dict[str, Any]:
+                async with semaphore:
+                    try:
+                        return await asyncio.to_thread(
+                            get_cached_ticket_data, key, max_comments_each, 0
+                        )
+                    except Exception as e:
+                        return {"key": key, "error": str(e)}
+
+            items = await asyncio.gather(
+                *(fetch(item["key"]) for item in results.get("items", []))
+            )
+            return await dumps_async(
+                {"total_count": results.get("total_count", 0), "items": items}
+            )
 
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
 
     @mcp.tool()
     async def count_jira_tickets(
@@ -264,11 +452,11 @@ def register_jira_tools(mcp: FastMCP) -> None:
             JSON string with count
         """
         try:
-            jira_service = JiraService()
-            count = jira_service.count_tickets(jql)
-            return json.dumps({"count": count})
+            jira_service = get_jira_service()
+            count = await asyncio.to_thread(jira_service.count_tickets, jql)
+            return dumps({"count": count})
         except Exception as e:
-            return json.dumps({"error": str(e)})
+            return error_response(str(e))
 
     @mcp.tool()
     async def get_jira_project_info(
@@ -308,19 +496,15 @@ def register_jira_tools(mcp: FastMCP) -> None:
             JSON string with project information
         """
         try:
-            # Normalize project key
-            project_key = project_key.strip().upper()
-
-            # Initialize Jira service
-            jira_service = JiraService()
+            project_key = normalize_project_key(project_key)
 
             # Get project info
-            project_info = jira_service.get_project_info(project_key)
+            project_info = await asyncio.to_thread(get_cached_project_info, project_key)
 
-            return json.dumps(project_info, indent=2)
+            return dumps(project_info)
 
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
 
     @mcp.tool()
     async def search_jira_child_tickets(
@@ -397,8 +581,9 @@ def register_jira_tools(mcp: FastMCP) -> None:
             JSON string with hierarchical ticket data
         """
         try:
-            jira_service = JiraService()
-            results = jira_service.search_child_tickets(
+            jira_service = get_jira_service()
+            results = await asyncio.to_thread(
+                jira_service.search_child_tickets,
                 parent_jql=parent_jql,
                 child_jql=child_jql,
                 parent_link_field=parent_link_field,
@@ -406,6 +591,6 @@ def register_jira_tools(mcp: FastMCP) -> None:
                 intermediate_jql=intermediate_jql,
                 max_results=max_results,
             )
-            return json.dumps(results, indent=2)
+            return await dumps_async(results)
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
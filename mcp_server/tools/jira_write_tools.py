@@ -1,13 +1,17 @@
 """MCP tools for Jira write operations (create/update tickets, add comments)."""
 
-import json
+import asyncio
 from typing import Annotated
 
 from fastmcp import FastMCP
 from pydantic import Field
 
-from ..services.jira_service import JiraService
-from .jira_tools import validate_ticket_key
+from ..utils.json_utils import dumps, error_response
+from .jira_tools import (
+    get_jira_service,
+    invalidate_ticket_cache,
+    validate_ticket_key,
+)
 
 
 def register_jira_write_tools(mcp: FastMCP) -> None:
@@ -74,8 +78,9 @@ def register_jira_write_tools(mcp: FastMCP) -> None:
         """
         try:
             project_key = project_key.strip().upper()
-            jira_service = JiraService()
-            result = jira_service.create_issue(
+            jira_service = get_jira_service()
+            result = await asyncio.to_thread(
+                jira_service.create_issue,
                 project_key=project_key,
                 summary=summary,
                 description=description,
@@ -85,9 +90,9 @@ def register_jira_write_tools(mcp: FastMCP) -> None:
                 components=components,
                 assignee=assignee,
             )
-            return json.dumps(result, indent=2)
+            return dumps(result)
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
 
     @mcp.tool()
     async def update_jira_ticket(
@@ -194,13 +199,11 @@ def register_jira_write_tools(mcp: FastMCP) -> None:
                     custom_fields,
                 ]
             ):
-                return json.dumps(
-                    {"error": "At least one field must be provided to update."},
-                    indent=2,
-                )
+                return error_response("At least one field must be provided to update.")
 
-            jira_service = JiraService()
-            result = jira_service.update_issue(
+            jira_service = get_jira_service()
+            result = await asyncio.to_thread(
+                jira_service.update_issue,
                 ticket_key=normalized_key,
                 summary=summary,
                 description=description,
@@ -211,11 +214,12 @@ def register_jira_write_tools(mcp: FastMCP) -> None:
                 transition=transition,
                 custom_fields=custom_fields,
             )
-            return json.dumps(result, indent=2)
+            invalidate_ticket_cache(normalized_key)
+            return dumps(result)
         except ValueError as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
 
     @mcp.tool()
     async def add_jira_comment(
@@ -248,13 +252,16 @@ def register_jira_write_tools(mcp: FastMCP) -> None:
         """
         try:
             normalized_key = validate_ticket_key(ticket_key)
-            jira_service = JiraService()
-            result = jira_service.add_comment(normalized_key, body)
-            return json.dumps(result, indent=2)
+            jira_service = get_jira_service()
+            result = await asyncio.to_thread(
+                jira_service.add_comment, normalized_key, body
+            )
+            invalidate_ticket_cache(normalized_key)
+            return dumps(result)
         except ValueError as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
 
     @mcp.tool()
     async def add_jira_weblink(
@@ -293,13 +300,16 @@ def register_jira_write_tools(mcp: FastMCP) -> None:
         """
         try:
             normalized_key = validate_ticket_key(ticket_key)
-            jira_service = JiraService()
-            result = jira_service.add_weblink(normalized_key, url, title)
-            return json.dumps(result, indent=2)
+            jira_service = get_jira_service()
+            result = await asyncio.to_thread(
+                jira_service.add_weblink, normalized_key, url, title
+            )
+            invalidate_ticket_cache(normalized_key)
+            return dumps(result)
         except ValueError as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
 
     @mcp.tool()
     async def add_jira_issue_link(
@@ -355,15 +365,20 @@ def register_jira_write_tools(mcp: FastMCP) -> None:
         try:
             normalized_key = validate_ticket_key(ticket_key)
             normalized_target = validate_ticket_key(target_ticket_key)
-            jira_service = JiraService()
-            result = jira_service.add_issue_link(
-                link_type, normalized_key, normalized_target
+            jira_service = get_jira_service()
+            result = await asyncio.to_thread(
+                jira_service.add_issue_link,
+                link_type,
+                normalized_key,
+                normalized_target,
             )
-            return json.dumps(result, indent=2)
+            invalidate_ticket_cache(normalized_key)
+            invalidate_ticket_cache(normalized_target)
+            return dumps(result)
         except ValueError as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
 
     @mcp.tool()
     async def list_jira_custom_field_options(
@@ -409,13 +424,15 @@ def register_jira_write_tools(mcp: FastMCP) -> None:
         """
         try:
             normalized_key = validate_ticket_key(ticket_key)
-            jira_service = JiraService()
-            result = jira_service.get_forge_field_options(normalized_key, field_id)
-            return json.dumps(result, indent=2)
+            jira_service = get_jira_service()
+            result = await asyncio.to_thread(
+                jira_service.get_forge_field_options, normalized_key, field_id
+            )
+            return dumps(result)
         except ValueError as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
 
     @mcp.tool()
     async def list_jira_transitions(
@@ -447,10 +464,12 @@ def register_jira_write_tools(mcp: FastMCP) -> None:
         """
         try:
             normalized_key = validate_ticket_key(ticket_key)
-            jira_service = JiraService()
-            result = jira_service.get_transitions(normalized_key)
-            return json.dumps(result, indent=2)
+            jira_service = get_jira_service()
+            result = await asyncio.to_thread(
+                jira_service.get_transitions, normalized_key
+            )
+            return dumps(result)
         except ValueError as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
@@ -15,13 +15,67 @@
 
 """MCP tools for DCI job operations."""
 
-import json
+import asyncio
+import threading
+from collections.abc import Callable
 from typing import Annotated
 
+from cachetools import TTLCache
 from fastmcp import FastMCP
 from pydantic import Field
 
 from ..services.dci_job_service import DCIJobService
+from ..utils.json_utils import dumps, dumps_async, dumps_members, error_response
+from ..utils.service_utils import shared_service
+
+# Serialized once for the searches that come back without any hits.
+_EMPTY_HITS = dumps({"hits": []})
+
+
+@shared_service
+def get_job_service() -> DCIJobService:
+    """Get the shared DCI job service, creating it on first use.
+
+    Reusing one service keeps its DCI context and HTTP session alive
+    across tool calls instead of opening a new connection every time.
+    """
+    return DCIJobService()
+
+
+# Files and test results are only ever added to a job, and agents tend to
+# look the same job up several times while analysing it: keep them briefly.
+# Empty listings are not cached, as the service also returns [] on errors.
+_listing_cache: TTLCache = TTLCache(maxsize=1024, ttl=60)
+_listing_cache_lock = threading.Lock()
+
+
+def _get_cached_listing(
+    kind: str, fetch: Callable[[str], list[dict]], job_id: str
+) -> list[dict]:
+    key = (kind, job_id)
+    with _listing_cache_lock:
+        listing = _listing_cache.get(key)
+    if listing is None:
+        listing = fetch(job_id)
+        if listing:
+            with _listing_cache_lock:
+                _listing_cache[key] = listing
+    return listing
+
+
+def get_cached_job_files(job_id: str) -> list[dict]:
+    """Get the files of a job through a short-lived (1 minute) cache."""
+    return _get_cached_listing("files", get_job_service().list_job_files, job_id)
+
+
+def get_cached_job_results(job_id: str) -> list[dict]:
+    """Get the test results of a job through a short-lived (1 minute) cache."""
+    return _get_cached_listing("results", get_job_service().list_job_results, job_id)
+
+
+def _extract_sources(hits: list[dict]) -> list[dict]:
+    """Unwrap the ``_source`` document of each search hit."""
+    return [source for hit in hits if (source := hit.get("_source")) is not None]
 
 
 def register_job_tools(mcp: FastMCP) -> None:
@@ -57,11 +111,11 @@ def register_job_tools(mcp: FastMCP) -> None:
             ),
         ] = 0,
         fields: Annotated[
-            list[str],
+            list[str] | None,
             Field(
-                description="List of fields to return. Fields are the one listed in the query description and responses. Must be specified as a list of strings, you can use 'components.name' or 'topic.id' to get only nested fields. If empty, no fields are returned.",
+                description="List of fields to return. Fields are the one listed in the query description and responses. Must be specified as a list of strings, you can use 'components.name' or 'topic.id' to get only nested fields. If empty or omitted, no fields are returned.",
             ),
-        ] = [],
+        ] = None,
         aggs: Annotated[
             dict | None,
             Field(
@@ -441,16 +495,21 @@ def register_job_tools(mcp: FastMCP) -> None:
         ```
         """
         try:
-            service = DCIJobService()
+            if fields:
+                # Convert fields list to server-side includes parameter
+                includes = ",".join(fields)
+            else:
+                # No job is returned without fields, only the total: fetch at
+                # most one hit, reduced to its id, rather than full documents.
+                limit = min(limit, 1)
+                includes = "id"
 
             # DCI server requires limit >= 1 to return aggregations
             if aggs is not None and limit == 0:
                 limit = 1
 
-            # Convert fields list to server-side includes parameter
-            includes = ",".join(fields) if fields else None
-
-            result = service.search_jobs(
+            result = await asyncio.to_thread(
+                get_job_service().search_jobs,
                 query=query,
                 sort=sort,
                 limit=limit,
@@ -461,9 +520,7 @@ def register_job_tools(mcp: FastMCP) -> None:
 
             # manage error message from the service
             if "message" in result:
-                return json.dumps(
-                    {"error": result.get("message", "Unknown error")}, indent=2
-                )
+                return error_response(result.get("message", "Unknown error"))
 
             # If aggregations were requested, return both aggregations and hits
             if aggs is not None:
@@ -471,45 +528,68 @@ def register_job_tools(mcp: FastMCP) -> None:
                 if "aggregations" in result:
                     response["aggregations"] = result["aggregations"]
                 if "hits" in result and "hits" in result["hits"]:
-                    if isinstance(fields, list):
-                        if fields:
-                            # Server already filtered fields; extract _source from ES hits
-                            response["hits"] = [
-                                hit["_source"]
-                                for hit in result["hits"]["hits"]
-                                if "_source" in hit
-                            ]
-                        else:
-                            # If fields is empty, return no jobs
-                            response["hits"] = []
+                    if fields:
+                        # Server already filtered fields; extract _source from ES hits
+                        response["hits"] = _extract_sources(result["hits"]["hits"])
                     else:
-                        response["hits"] = result["hits"]["hits"]
+                        # If fields is empty, return no jobs
+                        response["hits"] = []
                     response["total"] = result["hits"].get("total", 0)
                 else:
                     response["hits"] = []
                     response["total"] = 0
-                return json.dumps(response, indent=2)
+                return await dumps_async(response)
 
             # Regular search (no aggregations)
             # manage empty result
             if "hits" not in result or "hits" not in result["hits"]:
-                return json.dumps({"hits": []}, indent=2)
-
-            if isinstance(fields, list):
-                if fields:
-                    # Server already filtered fields; extract _source from ES hits
-                    result["hits"]["hits"] = [
-                        hit["_source"]
-                        for hit in result["hits"]["hits"]
-                        if "_source" in hit
-                    ]
-                else:
-                    # If fields is empty, return no jobs
-                    result["hits"]["hits"] = []
+                return _EMPTY_HITS
+
+            if fields:
+                # Server already filtered fields; extract _source from ES hits
+                result["hits"]["hits"] = _extract_sources(result["hits"]["hits"])
+            else:
+                # If fields is empty, return no jobs
+                result["hits"]["hits"] = []
+
+            return await dumps_async(result.get("hits", []), pretty=False)
+        except Exception as e:
+            return error_response(str(e))
+
+    @mcp.tool()
+    async def get_dci_job_artifacts(
+        job_id: Annotated[str, Field(description="The ID of the job")],
+    ) -> str:
+        """
+        Get the files and the test results of a DCI job in one call.
 
-            return json.dumps(result.get("hits", []))
+        The files and results are fetched concurrently. Prefer this tool
+        over separate lookups when both are needed, e.g. to find the log
+        files and the failing test suites of a job during a root cause
+        analysis.
+
+        ## Returned Data
+
+        Returns a JSON object with:
+        - **job_id**: The ID of the job
+        - **files**: List of file objects (id, name, mime, size, ...).
+          Use `download_dci_file` with a file id to fetch its content.
+        - **results**: List of test result objects (name, success, failures,
+          errors, skips, ...)
+
+        Returns:
+            JSON string with the job files and results
+        """
+        try:
+            files, results = await asyncio.gather(
+                asyncio.to_thread(get_cached_job_files, job_id),
+                asyncio.to_thread(get_cached_job_results, job_id),
+            )
+            return dumps_members(
+                ("job_id", job_id), ("files", files), ("results", results)
+            )
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
 
 
 # job_tools.py ends here
@@ -15,14 +15,27 @@
 
 """MCP tools for Red Hat Support Case operations."""
 
-import json
-import re
 from typing import Annotated
 
 from fastmcp import FastMCP
 from pydantic import Field
 
 from ..services.support_case_service import SupportCaseService
+from ..utils.json_utils import dumps_async, error_response
+from ..utils.service_utils import shared_service
+
+# Red Hat advisory types: security, bug fix and enhancement
+_ADVISORY_TYPES = frozenset({"RHSA", "RHBA", "RHEA"})
+
+
+@shared_service
+def get_support_case_service() -> SupportCaseService:
+    """Get the shared support case service, creating it on first use.
+
+    The service caches the SSO access token, so sharing it saves a token
+    exchange on every tool call.
+    """
+    return SupportCaseService()
 
 
 def validate_advisory_id(advisory_id: str) -> str:
@@ -40,9 +53,17 @@ def validate_advisory_id(advisory_id: str) -> str:
     advisory_id = advisory_id.strip().upper()
 
     # Red Hat advisory IDs: RHSA/RHBA/RHEA-YYYY:NNNN
-    pattern = r"^RH[SBE]A-\d{4}:\d{4,6}$"
-
-    if not re.match(pattern, advisory_id):
+    advisory_type, _, rest = advisory_id.partition("-")
+    year, separator, number = rest.partition(":")
+    if not (
+        advisory_type in _ADVISORY_TYPES
+        and separator
+        and len(year) == 4
+        and 4 <= len(number) <= 6
+        and rest.isascii()
+        and year.isdigit()
+        and number.isdigit()
+    ):
         raise ValueError(
             f"Invalid advisory ID format: '{advisory_id}'. "
             "Expected format: RHSA-2025:4018, RHBA-2025:1234, or RHEA-2025:5678"
@@ -65,10 +86,11 @@ def validate_case_number(case_number: str) -> str:
     """
     case_number = case_number.strip()
 
-    # Red Hat case numbers are numeric strings, typically 8 digits
-    pattern = r"^\d{5,10}$"
-
-    if not re.match(pattern, case_number):
+    # Red Hat case numbers are numeric strings, typically 8 digits. The
+    # isascii() check rejects other Unicode digits, which isdigit() accepts.
+    if not (
+        5 <= len(case_number) <= 10 and case_number.isascii() and case_number.isdigit()
+    ):
         raise ValueError(
             f"Invalid case number format: '{case_number}'. "
             "Expected a numeric case number (e.g., 03619625)"
@@ -138,16 +160,16 @@ def register_support_case_tools(mcp: FastMCP) -> None:
         try:
             normalized_case = validate_case_number(case_number)
 
-            service = SupportCaseService()
+            service = get_support_case_service()
 
             case_data = await service.get_case(normalized_case)
 
-            return json.dumps(case_data, indent=2)
+            return await dumps_async(case_data)
 
         except ValueError as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
 
     @mcp.tool()
     async def get_support_case_comments(
@@ -202,16 +224,16 @@ def register_support_case_tools(mcp: FastMCP) -> None:
         """
         try:
             normalized_case = validate_case_number(case_number)
-            service = SupportCaseService()
+            service = get_support_case_service()
             comments = await service.get_case_comments(
                 normalized_case, start_date, end_date
             )
-            return json.dumps(comments, indent=2)
+            return await dumps_async(comments)
 
         except ValueError as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
 
     @mcp.tool()
     async def list_support_case_attachments(
@@ -247,14 +269,14 @@ def register_support_case_tools(mcp: FastMCP) -> None:
         """
         try:
             normalized_case = validate_case_number(case_number)
-            service = SupportCaseService()
+            service = get_support_case_service()
             attachments = await service.list_case_attachments(normalized_case)
-            return json.dumps(attachments, indent=2)
+            return await dumps_async(attachments)
 
         except ValueError as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
 
     @mcp.tool()
     async def get_errata(
@@ -306,11 +328,11 @@ def register_support_case_tools(mcp: FastMCP) -> None:
         """
         try:
             normalized_id = validate_advisory_id(advisory_id)
-            service = SupportCaseService()
+            service = get_support_case_service()
             errata_data = await service.get_errata(normalized_id)
-            return json.dumps(errata_data, indent=2)
+            return await dumps_async(errata_data)
 
         except ValueError as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
@@ -1,12 +1,49 @@
 """MCP tools for DCI team operations."""
 
-import json
+import asyncio
+import threading
 from typing import Annotated
 
+from cachetools import TTLCache
 from fastmcp import FastMCP
 from pydantic import Field
 
 from ..services.dci_team_service import DCITeamService
+from ..utils.json_utils import dumps_async, error_response
+from ..utils.service_utils import shared_service
+
+
+@shared_service
+def get_team_service() -> DCITeamService:
+    """Get the shared DCI team service, creating it on first use."""
+    return DCITeamService()
+
+
+# Teams are rarely created or renamed, and agents repeat the same lookups
+# (e.g. resolving a team name to its ID): keep query results for 5 minutes.
+# Only successful listings are cached: DCI API errors come back as a
+# {"message", "status_code"} body and service failures as {"error"}.
+_team_query_cache: TTLCache = TTLCache(maxsize=256, ttl=300)
+_team_query_cache_lock = threading.Lock()
+
+
+def get_cached_team_query(query: str, sort: str, limit: int, offset: int) -> dict:
+    """Query teams through a 5 minute cache.
+
+    The returned dictionary is shared with the cache and must not be
+    modified in place.
+    """
+    key = (query, sort, limit, offset)
+    with _team_query_cache_lock:
+        result = _team_query_cache.get(key)
+    if result is None:
+        result = get_team_service().query_teams(
+            query=query, sort=sort, limit=limit, offset=offset
+        )
+        if "teams" in result:
+            with _team_query_cache_lock:
+                _team_query_cache[key] = result
+    return result
 
 
 def register_team_tools(mcp: FastMCP) -> None:
@@ -31,11 +68,11 @@ def register_team_tools(mcp: FastMCP) -> None:
         ] = 20,
         offset: Annotated[int, Field(description="Offset for pagination", ge=0)] = 0,
         fields: Annotated[
-            list[str],
+            list[str] | None,
             Field(
-                description="List of fields to return. Fields are the one listed in the query description and responses. Must be specified as a list of strings. If empty, no fields are returned.",
+                description="List of fields to return. Fields are the one listed in the query description and responses. Must be specified as a list of strings. If empty or omitted, no fields are returned.",
             ),
-        ] = [],
+        ] = None,
     ) -> str:
         """
         Lookup DCI teams with an advanced query language.
@@ -101,23 +138,28 @@ def register_team_tools(mcp: FastMCP) -> None:
             JSON string with list of teams and pagination info
         """
         try:
-            service = DCITeamService()
-
-            result = service.query_teams(
-                query=query, sort=sort, limit=limit, offset=offset
+            # Without fields no record is returned, only _meta.count: a
+            # single row is enough to get it.
+            if not fields:
+                limit = 1
+
+            # Copy the cached result before replacing its records below
+            result = dict(
+                await asyncio.to_thread(
+                    get_cached_team_query, query, sort, limit, offset
+                )
             )
 
-            if isinstance(fields, list) and fields:
-                # Filter the result to only include specified fields
-                if "teams" in result:
-                    filtered_result = [
+            if "teams" in result:
+                if fields:
+                    # Keep only the requested fields
+                    result["teams"] = [
                         {field: team.get(field) for field in fields}
                         for team in result["teams"]
                     ]
-                    result["teams"] = filtered_result
-            elif not fields:
-                result["teams"] = []
+                else:
+                    result["teams"] = []
 
-            return json.dumps(result, indent=2)
+            return await dumps_async(result)
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return error_response(str(e))
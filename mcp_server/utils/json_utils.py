@@ -0,0 +1,127 @@
+#
+# Copyright (C) 2026 Red Hat, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""JSON serialization helpers for MCP tool responses."""
+
+import asyncio
+import json
+import os
+from functools import lru_cache
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is a declared dependency
+    orjson = None  # type: ignore[assignment]
+
+# Responses are consumed by LLMs, for which indentation is only extra
+# tokens. Set MCP_PRETTY_JSON=true to indent them, e.g. when debugging.
+_PRETTY = os.getenv("MCP_PRETTY_JSON", "false").lower() == "true"
+
+# Responses with fewer list items than this are serialized inline; the
+# thread hand-off would cost more than the encoding itself.
+_INLINE_MAX_ITEMS = 100
+
+
+def dumps(obj: Any, pretty: bool | None = None) -> str:
+    """Serialize a tool response to a JSON string.
+
+    Uses orjson when available (several times faster than the stdlib
+    encoder on large job and ticket lists) and falls back to the stdlib
+    ``json`` module otherwise.
+
+    Args:
+        obj: JSON-serializable object
+        pretty: Indent the output with 2 spaces. Defaults to the
+            MCP_PRETTY_JSON setting (compact unless it is "true").
+
+    Returns:
+        JSON string
+    """
+    if pretty is None:
+        pretty = _PRETTY
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option).decode()
+    if pretty:
+        return json.dumps(obj, indent=2)
+    return json.dumps(obj)
+
+
+def dumps_members(*members: tuple[str, Any]) -> str:
+    """Serialize a JSON object given as ``(key, value)`` pairs.
+
+    In compact mode the envelope is written directly around each encoded
+    value, without building and walking a wrapper dict; this suits small
+    envelopes around large lists. Pretty mode falls back to :func:`dumps`.
+
+    Args:
+        members: Object members, in output order
+
+    Returns:
+        JSON string
+    """
+    if _PRETTY:
+        return dumps(dict(members))
+    return (
+        "{"
+        + ",".join(f"{dumps(key)}:{dumps(value, False)}" for key, value in members)
+        + "}"
+    )
+
+
+@lru_cache(maxsize=256)
+def error_response(message: str) -> str:
+    """Serialize an ``{"error": message}`` tool response.
+
+    Most error messages repeat (invalid keys, missing credentials), so the
+    serialized envelope is memoized per message.
+
+    Args:
+        message: Error message
+
+    Returns:
+        JSON string
+    """
+    return dumps({"error": message})
+
+
+def _item_count(obj: Any) -> int:
+    """Count the list items of a response, looking one level into dicts."""
+    if isinstance(obj, list):
+        return len(obj)
+    if isinstance(obj, dict):
+        return sum(len(value) for value in obj.values() if isinstance(value, list))
+    return 0
+
+
+async def dumps_async(obj: Any, pretty: bool | None = None) -> str:
+    """Serialize a tool response without blocking the event loop.
+
+    Large responses are encoded in a worker thread so that other tool
+    calls keep being served meanwhile; small ones are encoded inline.
+
+    Args:
+        obj: JSON-serializable object
+        pretty: Same as for :func:`dumps`
+
+    Returns:
+        JSON string
+    """
+    if _item_count(obj) < _INLINE_MAX_ITEMS:
+        return dumps(obj, pretty)
+    return await asyncio.to_thread(dumps, obj, pretty)
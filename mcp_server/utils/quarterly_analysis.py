@@ -16,12 +16,15 @@
 """Utilities for quarterly DCI job analysis."""
 
 import json
+import re
 import sys
 from collections import Counter, defaultdict
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+_CILAB_REF_RE = re.compile(r"CILAB-(\d+)")
+
 
 def has_debug_tag(job: dict[str, Any]) -> bool:
     """
@@ -394,10 +397,7 @@ def get_failure_rate(success: int, failure: int, error: int, total: int) -> str:
 
 def replace_cilab_references(text: str) -> str:
     """Replace CILAB-<num> references with Jira links."""
-    import re
-
-    pattern = r"CILAB-(\d+)"
-    return re.sub(pattern, r"https://redhat.atlassian.net/browse/CILAB-\1", text)
+    return _CILAB_REF_RE.sub(r"https://redhat.atlassian.net/browse/CILAB-\1", text)
 
 
 def format_job_id_link(job_id: str) -> str:
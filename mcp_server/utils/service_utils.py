@@ -0,0 +1,56 @@
+#
+# Copyright (C) 2026 Red Hat, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Shared service instances for the MCP tools."""
+
+import functools
+import threading
+from collections.abc import Callable
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+# A TypeVar rather than PEP 695 syntax keeps the module importable on the
+# older interpreters still used to run the test suite.
+def shared_service(factory: Callable[[], T]) -> Callable[[], T]:  # noqa: UP047
+    """
+    Turn a service factory into a getter for one shared instance.
+
+    The instance is created on the first call and returned by every later
+    one. Creation happens under a lock, so concurrent first calls from
+    worker threads still build a single service. A failed creation (e.g.
+    missing credentials) is not remembered and the next call retries.
+    ``getter.cache_clear()`` drops the instance.
+
+    Args:
+        factory: Callable creating the service
+
+    Returns:
+        Getter returning the shared service
+    """
+    instance: list[T] = []
+    lock = threading.Lock()
+
+    @functools.wraps(factory)
+    def get_service() -> T:
+        if not instance:
+            with lock:
+                if not instance:
+                    instance.append(factory())
+        return instance[0]
+
+    get_service.cache_clear = instance.clear  # type: ignore[attr-defined]
+    return get_service
@@ -0,0 +1,93 @@
+#
+# Copyright (C) 2026 Red Hat, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+"""Unit tests for DCI component tools."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastmcp import Client, FastMCP
+
+from mcp_server.tools import component_tools
+from mcp_server.tools.component_tools import register_component_tools
+
+
+@pytest.fixture
+def mock_component_service():
+    service = MagicMock()
+    with patch.object(component_tools, "get_component_service", return_value=service):
+        yield service
+
+
+@pytest.fixture
+def component_mcp(mock_component_service):
+    mcp = FastMCP("test")
+    register_component_tools(mcp)
+    return mcp
+
+
+@pytest.mark.asyncio
+async def test_query_dci_components_projects_fields(
+    mock_component_service, component_mcp
+):
+    mock_component_service.query_components.return_value = {
+        "components": [{"id": "c1", "name": "ocp", "version": "4.19.0", "state": "x"}],
+        "_meta": {"count": 1},
+    }
+
+    async with Client(component_mcp) as client:
+        result = await client.call_tool(
+            "query_dci_components",
+            {"query": "eq(type,ocp)", "fields": ["version", "id", "missing"]},
+        )
+
+    data = json.loads(result.content[0].text)
+    assert data == {
+        "components": [{"version": "4.19.0", "id": "c1", "missing": None}],
+        "_meta": {"count": 1},
+    }
+    # Fields come back in the order they were requested
+    assert list(data["components"][0]) == ["version", "id", "missing"]
+
+
+@pytest.mark.asyncio
+async def test_query_dci_components_without_fields(
+    mock_component_service, component_mcp
+):
+    mock_component_service.query_components.return_value = {
+        "components": [{"id": "c1"}],
+        "_meta": {"count": 1},
+    }
+
+    async with Client(component_mcp) as client:
+        result = await client.call_tool(
+            "query_dci_components", {"query": "eq(type,ocp)", "limit": 50}
+        )
+
+    assert json.loads(result.content[0].text) == {
+        "components": [],
+        "_meta": {"count": 1},
+    }
+    assert mock_component_service.query_components.call_args.kwargs["limit"] == 1
+
+
+@pytest.mark.asyncio
+async def test_query_dci_components_error(mock_component_service, component_mcp):
+    mock_component_service.query_components.side_effect = Exception("boom")
+
+    async with Client(component_mcp) as client:
+        result = await client.call_tool("query_dci_components", {"query": "x"})
+
+    assert json.loads(result.content[0].text) == {"error": "boom"}
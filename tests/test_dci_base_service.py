@@ -0,0 +1,50 @@
+#
+# Copyright (C) 2026 Red Hat, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+"""Unit tests for the DCI base service."""
+
+import threading
+from unittest.mock import patch
+
+from mcp_server.services.dci_base_service import DCIBaseService
+from mcp_server.services.dci_job_service import DCIJobService
+
+
+def test_dci_context_is_reused_per_thread():
+    """A service reuses its context within a thread, not across threads."""
+    service = DCIJobService()
+    with patch.object(
+        DCIBaseService, "_build_dci_context", side_effect=lambda: object()
+    ) as mock_build:
+        first = service._get_dci_context()
+        second = service._get_dci_context()
+        other = []
+        thread = threading.Thread(
+            target=lambda: other.append(service._get_dci_context())
+        )
+        thread.start()
+        thread.join()
+
+    assert first is second
+    assert other[0] is not first
+    assert mock_build.call_count == 2
+
+
+def test_dci_context_is_not_shared_between_services():
+    with patch.object(
+        DCIBaseService, "_build_dci_context", side_effect=lambda: object()
+    ):
+        assert DCIJobService()._get_dci_context() is not (
+            DCIJobService()._get_dci_context()
+        )
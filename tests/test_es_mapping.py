@@ -0,0 +1,46 @@
+#
+# Copyright (C) 2026 Red Hat, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+"""Unit tests for the ElasticSearch mapping resource."""
+
+import json
+
+import pytest
+from fastmcp import Client, FastMCP
+
+from mcp_server.resources import es_mapping
+from mcp_server.resources.es_mapping import register_es_mapping_resource
+
+
+@pytest.fixture(autouse=True)
+def clear_mapping_cache():
+    es_mapping.load_es_mapping.cache_clear()
+    yield
+    es_mapping.load_es_mapping.cache_clear()
+
+
+@pytest.mark.asyncio
+async def test_get_es_mapping_serialized_once():
+    mcp = FastMCP("test")
+    register_es_mapping_resource(mcp)
+
+    async with Client(mcp) as client:
+        first = await client.read_resource("dci://elasticsearch/mapping")
+        second = await client.read_resource("dci://elasticsearch/mapping")
+
+    with open(es_mapping._MAPPING_PATH) as f:
+        assert json.loads(first[0].text) == json.load(f)
+    assert second[0].text == first[0].text
+    info = es_mapping.load_es_mapping.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
@@ -15,13 +15,24 @@
 
 """Unit tests for Jira tools and service."""
 
+import json
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
+import requests
+from fastmcp import Client, FastMCP
 from jira.exceptions import JIRAError
 
 from mcp_server.services.jira_service import JiraService, _simplify_field_value
-from mcp_server.tools.jira_tools import validate_ticket_key
+from mcp_server.tools import jira_tools
+from mcp_server.tools.jira_tools import (
+    get_cached_project_info,
+    get_cached_ticket_data,
+    invalidate_ticket_cache,
+    normalize_project_key,
+    validate_ticket_key,
+)
 
 # -- _simplify_field_value tests --
 
@@ -107,6 +118,11 @@ def test_validate_ticket_key_with_whitespace():
     assert validate_ticket_key("  CILAB-1234  ") == "CILAB-1234"
 
 
+def test_validate_ticket_key_lowercase():
+    assert validate_ticket_key("cilab-1234") == "CILAB-1234"
+    assert validate_ticket_key(" Ocp-5678 ") == "OCP-5678"
+
+
 def test_validate_ticket_key_invalid():
     with pytest.raises(ValueError, match="Invalid ticket key format"):
         validate_ticket_key("invalid")
@@ -121,6 +137,122 @@ def test_validate_ticket_key_invalid():
         validate_ticket_key("CILAB")
 
 
+def test_validate_ticket_key_edge_cases():
+    assert validate_ticket_key("A1-0") == "A1-0"
+    for ticket_key in ("A-1", "1A-1", "CILAB-", "-1", "CILAB-1-2", "CI_LAB-1"):
+        with pytest.raises(ValueError, match="Invalid ticket key format"):
+            validate_ticket_key(ticket_key)
+
+
+def test_validate_ticket_key_non_ascii():
+    with pytest.raises(ValueError, match="Invalid ticket key format"):
+        validate_ticket_key("c\u0131lab-1234")
+
+    with pytest.raises(ValueError, match="Invalid ticket key format"):
+        validate_ticket_key("CILAB-\u0663")
+
+
+def test_normalize_project_key():
+    key = "CILAB"
+    assert normalize_project_key(key) is key
+    assert normalize_project_key("OCP4") == "OCP4"
+    assert normalize_project_key(" cilab ") == "CILAB"
+    assert normalize_project_key("Ocp") == "OCP"
+
+
+# -- ticket/project cache tests --
+
+
+@pytest.fixture
+def clear_jira_caches():
+    jira_tools._ticket_cache.clear()
+    jira_tools._project_cache.clear()
+    yield
+    jira_tools._ticket_cache.clear()
+    jira_tools._project_cache.clear()
+
+
+def test_cached_ticket_data_hits_service_once(clear_jira_caches):
+    with patch.object(jira_tools, "get_jira_service") as mock_get:
+        mock_get.return_value.get_ticket_data.return_value = {"key": "CILAB-1"}
+        assert get_cached_ticket_data("CILAB-1", 10, 0) == {"key": "CILAB-1"}
+        assert get_cached_ticket_data("CILAB-1", 10, 0) == {"key": "CILAB-1"}
+        get_cached_ticket_data("CILAB-1", 20, 0)
+    assert mock_get.return_value.get_ticket_data.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_search_jira_tickets_detailed(clear_jira_caches):
+    mcp = FastMCP("test")
+    jira_tools.register_jira_tools(mcp)
+
+    def get_ticket_data(key, max_comments, comment_offset):
+        if key == "CILAB-2":
+            raise Exception("Jira ticket error: forbidden")
+        return {"key": key, "max_comments": max_comments}
+
+    with patch.object(jira_tools, "get_jira_service") as mock_get:
+        service = mock_get.return_value
+        service.search_tickets.return_value = {
+            "total_count": 3,
+            "items": [{"key": "CILAB-1"}, {"key": "CILAB-2"}, {"key": "CILAB-3"}],
+        }
+        service.get_ticket_data.side_effect = get_ticket_data
+        async with Client(mcp) as client:
+            result = await client.call_tool(
+                "search_jira_tickets_detailed",
+                {"jql": "project = CILAB", "max_results": 3, "max_comments_each": 2},
+            )
+
+    data = json.loads(result.content[0].text)
+    service.search_tickets.assert_called_once_with("project = CILAB", 3, 0)
+    assert data["total_count"] == 3
+    assert data["items"] == [
+        {"key": "CILAB-1", "max_comments": 2},
+        {"key": "CILAB-2", "error": "Jira ticket error: forbidden"},
+        {"key": "CILAB-3", "max_comments": 2},
+    ]
+
+
+def test_invalidate_ticket_cache(clear_jira_caches):
+    with patch.object(jira_tools, "get_jira_service") as mock_get:
+        mock_get.return_value.get_ticket_data.return_value = {"key": "CILAB-1"}
+        get_cached_ticket_data("CILAB-1", 10, 0)
+        get_cached_ticket_data("CILAB-1", 20, 0)
+        get_cached_ticket_data("CILAB-2", 10, 0)
+        invalidate_ticket_cache("CILAB-1")
+        get_cached_ticket_data("CILAB-1", 10, 0)
+        get_cached_ticket_data("CILAB-2", 10, 0)
+    assert mock_get.return_value.get_ticket_data.call_count == 4
+
+
+def test_cached_project_info_hits_service_once(clear_jira_caches):
+    with patch.object(jira_tools, "get_jira_service") as mock_get:
+        mock_get.return_value.get_project_info.return_value = {"key": "CILAB"}
+        get_cached_project_info("CILAB")
+        get_cached_project_info("CILAB")
+    mock_get.return_value.get_project_info.assert_called_once_with("CILAB")
+
+
+def test_cached_project_info_expires(clear_jira_caches):
+    with patch.object(jira_tools, "get_jira_service") as mock_get:
+        get_cached_project_info("CILAB")
+        jira_tools._project_cache.expire(time.monotonic() + 601)
+        get_cached_project_info("CILAB")
+    assert mock_get.return_value.get_project_info.call_count == 2
+
+
+def test_cached_ticket_data_does_not_cache_errors(clear_jira_caches):
+    with patch.object(jira_tools, "get_jira_service") as mock_get:
+        mock_get.return_value.get_ticket_data.side_effect = [
+            Exception("boom"),
+            {"key": "CILAB-1"},
+        ]
+        with pytest.raises(Exception, match="boom"):
+            get_cached_ticket_data("CILAB-1", 10, 0)
+        assert get_cached_ticket_data("CILAB-1", 10, 0) == {"key": "CILAB-1"}
+
+
 # -- _get_field_map tests --
 
 
@@ -132,6 +264,19 @@ def _make_jira_service():
     return svc
 
 
+def test_jira_session_uses_pooled_adapter():
+    with patch.dict("os.environ", {"JIRA_API_TOKEN": "test-token"}):
+        with patch("mcp_server.services.jira_service.JIRA") as mock_jira:
+            mock_jira.return_value._session = requests.Session()
+            svc = JiraService()
+    for url in ("https://redhat.atlassian.net", "http://jira.example.com"):
+        adapter = svc.jira._session.get_adapter(url)
+        assert adapter._pool_connections == 10
+        assert adapter._pool_maxsize == 20
+        # Retries stay with the jira client's own ResilientSession
+        assert adapter.max_retries.total == 0
+
+
 def test_get_field_map_caching():
     svc = _make_jira_service()
     svc.jira.fields.return_value = [
@@ -162,6 +307,32 @@ def test_get_field_map_failure_graceful():
     assert result == {}
 
 
+def test_get_field_map_failure_is_retried():
+    svc = _make_jira_service()
+    svc.jira.fields.side_effect = [
+        Exception("API error"),
+        [{"id": "customfield_10001", "name": "Sprint", "schema": {}}],
+    ]
+
+    assert svc._get_field_map() == {}
+    assert svc._get_field_map() == {"customfield_10001": "Sprint"}
+
+
+def test_resolve_assignee_caches_account_id():
+    svc = _make_jira_service()
+    svc._is_cloud = True
+    svc.jira._session.get.return_value.json.return_value = [{"accountId": "abc123"}]
+
+    assert svc._resolve_assignee("Jane Doe") == {"accountId": "abc123"}
+    assert svc._resolve_assignee("Jane Doe") == {"accountId": "abc123"}
+    svc.jira._session.get.assert_called_once()
+
+    # Account IDs expire after an hour
+    svc._account_ids.expire(time.monotonic() + 3600)
+    assert svc._resolve_assignee("Jane Doe") == {"accountId": "abc123"}
+    assert svc.jira._session.get.call_count == 2
+
+
 # -- get_ticket_data with custom fields --
 
 
@@ -0,0 +1,171 @@
+#
+# Copyright (C) 2026 Red Hat, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Unit tests for DCI job tools."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastmcp import Client, FastMCP
+
+from mcp_server.tools import job_tools
+from mcp_server.tools.job_tools import register_job_tools
+
+
+@pytest.fixture(autouse=True)
+def clear_listing_cache():
+    job_tools._listing_cache.clear()
+    yield
+    job_tools._listing_cache.clear()
+
+
+@pytest.fixture
+def mock_job_service():
+    service = MagicMock()
+    with patch.object(job_tools, "get_job_service", return_value=service):
+        yield service
+
+
+@pytest.fixture
+def job_mcp(mock_job_service):
+    mcp = FastMCP("test")
+    register_job_tools(mcp)
+    return mcp
+
+
+@pytest.mark.asyncio
+async def test_get_dci_job_artifacts(mock_job_service, job_mcp):
+    mock_job_service.list_job_files.return_value = [{"id": "file-1"}]
+    mock_job_service.list_job_results.return_value = [{"name": "tests"}]
+
+    async with Client(job_mcp) as client:
+        result = await client.call_tool("get_dci_job_artifacts", {"job_id": "job-1"})
+
+    data = json.loads(result.content[0].text)
+    assert data == {
+        "job_id": "job-1",
+        "files": [{"id": "file-1"}],
+        "results": [{"name": "tests"}],
+    }
+    mock_job_service.list_job_files.assert_called_once_with("job-1")
+    mock_job_service.list_job_results.assert_called_once_with("job-1")
+
+
+@pytest.mark.asyncio
+async def test_get_dci_job_artifacts_error(mock_job_service, job_mcp):
+    mock_job_service.list_job_results.side_effect = Exception("boom")
+
+    async with Client(job_mcp) as client:
+        result = await client.call_tool("get_dci_job_artifacts", {"job_id": "job-1"})
+
+    assert json.loads(result.content[0].text) == {"error": "boom"}
+
+
+@pytest.mark.asyncio
+async def test_get_dci_job_artifacts_cached(mock_job_service, job_mcp):
+    mock_job_service.list_job_files.return_value = [{"id": "file-1"}]
+    mock_job_service.list_job_results.return_value = []
+
+    async with Client(job_mcp) as client:
+        await client.call_tool("get_dci_job_artifacts", {"job_id": "job-1"})
+        await client.call_tool("get_dci_job_artifacts", {"job_id": "job-1"})
+
+    # The files are served from the cache the second time, while the empty
+    # results, which may come from a failed lookup, are fetched again.
+    mock_job_service.list_job_files.assert_called_once_with("job-1")
+    assert mock_job_service.list_job_results.call_count == 2
+
+
+def test_register_does_not_build_service():
+    """The job service is resolved per call, not when tools are registered."""
+    with patch.object(job_tools, "get_job_service") as mock_get:
+        register_job_tools(FastMCP("test"))
+    mock_get.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_search_dci_jobs_unwraps_sources(mock_job_service, job_mcp):
+    mock_job_service.search_jobs.return_value = {
+        "hits": {
+            "total": {"value": 2, "relation": "eq"},
+            "hits": [{"_source": {"id": "job-1"}}, {"_id": "job-2"}],
+        }
+    }
+
+    async with Client(job_mcp) as client:
+        result = await client.call_tool(
+            "search_dci_jobs", {"query": "(status='failure')", "fields": ["id"]}
+        )
+
+    assert json.loads(result.content[0].text) == {
+        "total": {"value": 2, "relation": "eq"},
+        "hits": [{"id": "job-1"}],
+    }
+    assert mock_job_service.search_jobs.call_args.kwargs["includes"] == "id"
+
+
+@pytest.mark.asyncio
+async def test_search_dci_jobs_aggs_unwraps_sources(mock_job_service, job_mcp):
+    mock_job_service.search_jobs.return_value = {
+        "aggregations": {"by_status": {"buckets": []}},
+        "hits": {"total": 1, "hits": [{"_source": {"id": "job-1"}}]},
+    }
+
+    async with Client(job_mcp) as client:
+        result = await client.call_tool(
+            "search_dci_jobs",
+            {
+                "query": "(status='failure')",
+                "fields": ["id"],
+                "aggs": {"by_status": {"terms": {"field": "status"}}},
+            },
+        )
+
+    assert json.loads(result.content[0].text) == {
+        "aggregations": {"by_status": {"buckets": []}},
+        "hits": [{"id": "job-1"}],
+        "total": 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_search_dci_jobs_without_hits(mock_job_service, job_mcp):
+    mock_job_service.search_jobs.return_value = {}
+
+    async with Client(job_mcp) as client:
+        result = await client.call_tool(
+            "search_dci_jobs", {"query": "(status='failure')", "fields": ["id"]}
+        )
+
+    assert result.content[0].text == job_tools._EMPTY_HITS
+    assert json.loads(result.content[0].text) == {"hits": []}
+
+
+@pytest.mark.asyncio
+async def test_search_dci_jobs_without_fields(mock_job_service, job_mcp):
+    mock_job_service.search_jobs.return_value = {
+        "hits": {"total": 42, "hits": [{"_source": {"id": "job-1"}}]}
+    }
+
+    async with Client(job_mcp) as client:
+        result = await client.call_tool(
+            "search_dci_jobs", {"query": "(status='failure')", "limit": 50}
+        )
+
+    assert json.loads(result.content[0].text) == {"total": 42, "hits": []}
+    # Only the total is returned, so no more than one bare hit is fetched
+    kwargs = mock_job_service.search_jobs.call_args.kwargs
+    assert (kwargs["limit"], kwargs["includes"]) == (1, "id")
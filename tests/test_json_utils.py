@@ -0,0 +1,107 @@
+#
+# Copyright (C) 2026 Red Hat, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Unit tests for the JSON serialization helpers."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from mcp_server.utils import json_utils
+from mcp_server.utils.json_utils import (
+    dumps,
+    dumps_async,
+    dumps_members,
+    error_response,
+)
+
+
+def test_dumps_round_trip():
+    data = {"hits": [{"id": "job-1", "status": "success"}], "total": 1}
+    assert json.loads(dumps(data)) == data
+
+
+def test_dumps_returns_str():
+    assert isinstance(dumps({"error": "boom"}), str)
+
+
+def test_dumps_non_ascii():
+    data = {"summary": "café ✅"}
+    assert json.loads(dumps(data)) == data
+
+
+def test_dumps_non_str_keys():
+    assert json.loads(dumps({1: "one"})) == {"1": "one"}
+
+
+def test_dumps_stdlib_fallback():
+    data = {"teams": [{"id": "team-1", "name": "test-team"}]}
+    with patch.object(json_utils, "orjson", None):
+        assert json.loads(dumps(data)) == data
+
+
+def test_dumps_compact():
+    data = {"hits": [{"id": "job-1"}]}
+    assert dumps(data, pretty=False) == json.dumps(data, separators=(",", ":"))
+    assert "\n" in dumps(data, pretty=True)
+
+
+def test_dumps_default_follows_pretty_setting():
+    data = {"hits": [{"id": "job-1"}]}
+    with patch.object(json_utils, "_PRETTY", False):
+        assert "\n" not in dumps(data)
+    with patch.object(json_utils, "_PRETTY", True):
+        assert dumps(data) == dumps(data, pretty=True)
+
+
+def test_dumps_stdlib_fallback_compact():
+    data = {"hits": [{"id": "job-1"}]}
+    with patch.object(json_utils, "orjson", None):
+        assert dumps(data, pretty=False) == json.dumps(data)
+
+
+@pytest.mark.asyncio
+async def test_dumps_async_small_payload_inline():
+    data = {"items": [{"key": "CILAB-1"}]}
+    with patch.object(json_utils.asyncio, "to_thread") as to_thread:
+        assert json.loads(await dumps_async(data)) == data
+    to_thread.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_dumps_async_large_payload_in_thread():
+    data = {"items": [{"key": f"CILAB-{i}"} for i in range(500)], "total": 500}
+    with patch.object(
+        json_utils.asyncio, "to_thread", wraps=json_utils.asyncio.to_thread
+    ) as to_thread:
+        assert json.loads(await dumps_async(data, pretty=False)) == data
+    to_thread.assert_called_once_with(dumps, data, False)
+
+
+def test_error_response():
+    error_response.cache_clear()
+    message = "Invalid ticket key format: 'a\"b'"
+    assert json.loads(error_response(message)) == {"error": message}
+    assert error_response(message) is error_response(message)
+    assert error_response.cache_info().misses == 1
+
+
+def test_dumps_members():
+    members = (("job_id", 'job-"1"'), ("files", [{"id": "f1"}]), ("count", 1))
+    with patch.object(json_utils, "_PRETTY", False):
+        assert dumps_members(*members) == dumps(dict(members), pretty=False)
+    with patch.object(json_utils, "_PRETTY", True):
+        assert dumps_members(*members) == dumps(dict(members), pretty=True)
@@ -15,6 +15,8 @@
 
 """Unit tests for RCA prompt helpers and dynamic prompt generation."""
 
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -25,6 +27,7 @@ from mcp_server.prompts.prompts import (
     _classify_job_type,
     _fetch_job_files,
     _fetch_job_metadata,
+    _job_metadata_cache,
     _prioritize_files,
 )
 
@@ -327,6 +330,12 @@ class TestBuildFileSection:
 class TestFetchJobMetadata:
     """Tests for _fetch_job_metadata()."""
 
+    @pytest.fixture(autouse=True)
+    def clear_metadata_cache(self):
+        _job_metadata_cache.clear()
+        yield
+        _job_metadata_cache.clear()
+
     @patch("mcp_server.prompts.prompts.DCIJobService")
     def test_successful_fetch(self, mock_cls):
         mock_service = MagicMock()
@@ -356,6 +365,34 @@ class TestFetchJobMetadata:
         assert result["pipeline_name"] == "acm-deploy"
         assert result["status"] == "failure"
 
+    @patch("mcp_server.prompts.prompts.DCIJobService")
+    def test_cache_ttl_depends_on_status(self, mock_cls):
+        def search_jobs(query, limit, includes):
+            job_id = query.split("'")[1]
+            status = "running" if job_id == "job-running" else "success"
+            return {"hits": {"hits": [{"_source": {"id": job_id, "status": status}}]}}
+
+        mock_cls.return_value.search_jobs.side_effect = search_jobs
+        _fetch_job_metadata("job-running")
+        _fetch_job_metadata("job-done")
+        _fetch_job_metadata("job-running")
+        _fetch_job_metadata("job-done")
+        assert mock_cls.return_value.search_jobs.call_count == 2
+
+        # After a minute only the finished job is still cached
+        _job_metadata_cache.expire(time.monotonic() + 60)
+        assert "job-done" in _job_metadata_cache
+        assert "job-running" not in _job_metadata_cache
+
+    @patch("mcp_server.prompts.prompts.DCIJobService")
+    def test_failures_are_not_cached(self, mock_cls):
+        mock_cls.return_value.search_jobs.side_effect = [
+            {"hits": {"hits": []}},
+            {"hits": {"hits": [{"_source": {"id": "job-1", "status": "failure"}}]}},
+        ]
+        assert _fetch_job_metadata("job-1") is None
+        assert _fetch_job_metadata("job-1")["status"] == "failure"
+
     @patch("mcp_server.prompts.prompts.DCIJobService")
     def test_empty_hits_returns_none(self, mock_cls):
         mock_service = MagicMock()
@@ -368,6 +405,12 @@ class TestFetchJobMetadata:
         mock_cls.side_effect = Exception("connection error")
         assert _fetch_job_metadata("job-1") is None
 
+    @patch("mcp_server.prompts.prompts.DCIJobService")
+    def test_invalid_job_id_is_not_searched(self, mock_cls):
+        assert _fetch_job_metadata("x') or (id='y") is None
+        assert _fetch_job_metadata("") is None
+        mock_cls.assert_not_called()
+
 
 # ---------------------------------------------------------------------------
 # _fetch_job_files (with mocked service)
@@ -397,6 +440,87 @@ class TestFetchJobFiles:
         assert len(result) == 2
         assert result[0]["name"] == "ansible.log"
 
+    @patch("mcp_server.prompts.prompts.DCIJobService")
+    def test_paginates_until_short_page(self, mock_cls):
+        """Verify pages are fetched until one comes back short."""
+        full_page = MagicMock()
+        full_page.json.return_value = {
+            "files": [{"id": f"f{i}", "name": f"{i}.log"} for i in range(200)]
+        }
+        last_page = MagicMock()
+        last_page.json.return_value = {"files": [{"id": "f200", "name": "x.log"}]}
+        with patch(
+            "dciclient.v1.api.job.list_files", side_effect=[full_page, last_page]
+        ) as mock_list:
+            result = _fetch_job_files("job-1")
+        assert result is not None
+        assert len(result) == 201
+        assert result[-1] == {"id": "f200", "name": "x.log", "size": 0, "mime": ""}
+        assert [c.kwargs["offset"] for c in mock_list.call_args_list] == [0, 200]
+
+    @patch("mcp_server.prompts.prompts.DCIJobService")
+    def test_fetches_remaining_pages_concurrently_with_count(self, mock_cls):
+        """Verify the total count drives the remaining page offsets."""
+
+        def list_files(context, job_id, limit, offset):
+            response = MagicMock()
+            size = min(limit, 450 - offset)
+            response.json.return_value = {
+                "files": [{"id": f"f{offset + i}"} for i in range(size)],
+                "_meta": {"count": 450},
+            }
+            return response
+
+        with patch(
+            "dciclient.v1.api.job.list_files", side_effect=list_files
+        ) as mock_list:
+            result = _fetch_job_files("job-1")
+        assert result is not None
+        assert [f["id"] for f in result] == [f"f{i}" for i in range(450)]
+        offsets = sorted(c.kwargs["offset"] for c in mock_list.call_args_list)
+        assert offsets == [0, 200, 400]
+
+    @patch("mcp_server.prompts.prompts.DCIJobService")
+    def test_count_equal_to_page_size(self, mock_cls):
+        """Verify a full page at the count is followed until an empty one."""
+        full_page = MagicMock()
+        full_page.json.return_value = {
+            "files": [{"id": f"f{i}"} for i in range(200)],
+            "_meta": {"count": 200},
+        }
+        empty_page = MagicMock()
+        empty_page.json.return_value = {"files": [], "_meta": {"count": 200}}
+        with patch(
+            "dciclient.v1.api.job.list_files", side_effect=[full_page, empty_page]
+        ) as mock_list:
+            result = _fetch_job_files("job-1")
+        assert result is not None
+        assert len(result) == 200
+        assert [c.kwargs["offset"] for c in mock_list.call_args_list] == [0, 200]
+
+    @pytest.mark.parametrize("count", [250, 0, None])
+    @patch("mcp_server.prompts.prompts.DCIJobService")
+    def test_does_not_trust_count(self, mock_cls, count):
+        """Verify a stale, zero or missing count does not truncate the files."""
+
+        def list_files(context, job_id, limit, offset):
+            response = MagicMock()
+            size = max(0, min(limit, 650 - offset))
+            response.json.return_value = {
+                "files": [{"id": f"f{offset + i}"} for i in range(size)],
+                "_meta": {"count": count},
+            }
+            return response
+
+        with patch(
+            "dciclient.v1.api.job.list_files", side_effect=list_files
+        ) as mock_list:
+            result = _fetch_job_files("job-1")
+        assert result is not None
+        assert [f["id"] for f in result] == [f"f{i}" for i in range(650)]
+        offsets = sorted(c.kwargs["offset"] for c in mock_list.call_args_list)
+        assert offsets == [0, 200, 400, 600]
+
     @patch("mcp_server.prompts.prompts.DCIJobService")
     def test_exception_returns_none(self, mock_cls):
         """Verify API exception returns None (not empty list)."""
@@ -516,6 +640,47 @@ class TestRcaPromptIntegration:
         assert "Job Context" not in result
         assert "Available Files" not in result
 
+    @pytest.mark.asyncio
+    @patch("mcp_server.prompts.prompts._fetch_job_files")
+    @patch("mcp_server.prompts.prompts._fetch_job_metadata")
+    async def test_fetches_run_concurrently(self, mock_meta, mock_files):
+        """Metadata and files are fetched at the same time, off the loop."""
+        # Each fetch waits for the other one: this only completes when both
+        # run at the same time in separate threads.
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fetch_metadata(job_id):
+            barrier.wait()
+            return {"status": "failure"}
+
+        def fetch_files(job_id):
+            barrier.wait()
+            return [{"id": "f1", "name": "ansible.log", "size": 4096}]
+
+        mock_meta.side_effect = fetch_metadata
+        mock_files.side_effect = fetch_files
+
+        from mcp_server.prompts.prompts import register_prompts
+
+        mcp = MagicMock()
+        prompts_registered = {}
+
+        def fake_prompt():
+            def decorator(fn):
+                prompts_registered[fn.__name__] = fn
+                return fn
+
+            return decorator
+
+        mcp.prompt = fake_prompt
+        register_prompts(mcp)
+
+        result = await prompts_registered["rca"]("job-concurrent")
+
+        assert "Available Files" in result
+        mock_meta.assert_called_once_with("job-concurrent")
+        mock_files.assert_called_once_with("job-concurrent")
+
     @pytest.mark.asyncio
     @patch("mcp_server.prompts.prompts._fetch_job_files")
     @patch("mcp_server.prompts.prompts._fetch_job_metadata")
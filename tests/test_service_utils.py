@@ -0,0 +1,72 @@
+#
+# Copyright (C) 2026 Red Hat, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Unit tests for the shared service helper."""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from mcp_server.utils.service_utils import shared_service
+
+
+def test_shared_service_creates_once():
+    factory = MagicMock(__name__="factory", side_effect=lambda: object())
+    get_service = shared_service(factory)
+
+    assert get_service() is get_service()
+    factory.assert_called_once_with()
+
+
+def test_shared_service_creates_once_across_threads():
+    calls = []
+
+    def factory():
+        calls.append(None)
+        time.sleep(0.05)
+        return object()
+
+    get_service = shared_service(factory)
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(get_service())) for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_shared_service_retries_after_failure():
+    factory = MagicMock(__name__="factory", side_effect=[ValueError("no token"), "svc"])
+    get_service = shared_service(factory)
+
+    with pytest.raises(ValueError, match="no token"):
+        get_service()
+    assert get_service() == "svc"
+
+
+def test_shared_service_cache_clear():
+    get_service = shared_service(object)
+    first = get_service()
+
+    get_service.cache_clear()
+
+    assert get_service() is not first
@@ -214,6 +214,9 @@ def test_validate_case_number_invalid():
     with pytest.raises(ValueError, match="Invalid case number format"):
         validate_case_number("12345678901")  # Too long (11 digits)
 
+    with pytest.raises(ValueError, match="Invalid case number format"):
+        validate_case_number("\u0660\u0661\u0662\u0663\u0664")  # Arabic-Indic digits
+
 
 # -- Service tests with mocked HTTP --
 
@@ -561,6 +564,12 @@ def test_validate_advisory_id_invalid():
     with pytest.raises(ValueError, match="Invalid advisory ID format"):
         validate_advisory_id("RHSA-25:4018")  # Two-digit year
 
+    with pytest.raises(ValueError, match="Invalid advisory ID format"):
+        validate_advisory_id("RHSA-2025:40:18")  # Extra separator
+
+    with pytest.raises(ValueError, match="Invalid advisory ID format"):
+        validate_advisory_id("RHSA-2025:\u0664\u0660\u0661\u0668")  # Non-ASCII digits
+
     with pytest.raises(ValueError, match="Invalid advisory ID format"):
         validate_advisory_id("")
 
@@ -0,0 +1,94 @@
+#
+# Copyright (C) 2026 Red Hat, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+"""Unit tests for DCI team tools."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastmcp import Client, FastMCP
+
+from mcp_server.tools import team_tools
+from mcp_server.tools.team_tools import register_team_tools
+
+
+@pytest.fixture(autouse=True)
+def clear_team_query_cache():
+    team_tools._team_query_cache.clear()
+    yield
+    team_tools._team_query_cache.clear()
+
+
+@pytest.fixture
+def mock_team_service():
+    service = MagicMock()
+    with patch.object(team_tools, "get_team_service", return_value=service):
+        yield service
+
+
+@pytest.fixture
+def team_mcp(mock_team_service):
+    mcp = FastMCP("test")
+    register_team_tools(mcp)
+    return mcp
+
+
+@pytest.mark.asyncio
+async def test_query_dci_teams_cached(mock_team_service, team_mcp):
+    mock_team_service.query_teams.return_value = {
+        "teams": [{"id": "t1", "name": "qa", "state": "active"}],
+        "_meta": {"count": 1},
+    }
+
+    async with Client(team_mcp) as client:
+        first = await client.call_tool(
+            "query_dci_teams", {"query": "eq(name,qa)", "fields": ["id"]}
+        )
+        second = await client.call_tool(
+            "query_dci_teams", {"query": "eq(name,qa)", "fields": ["name"]}
+        )
+
+    assert json.loads(first.content[0].text)["teams"] == [{"id": "t1"}]
+    assert json.loads(second.content[0].text)["teams"] == [{"name": "qa"}]
+    mock_team_service.query_teams.assert_called_once_with(
+        query="eq(name,qa)", sort="-created_at", limit=20, offset=0
+    )
+
+
+@pytest.mark.asyncio
+async def test_query_dci_teams_errors_not_cached(mock_team_service, team_mcp):
+    mock_team_service.query_teams.return_value = {"error": "boom", "message": "x"}
+
+    async with Client(team_mcp) as client:
+        await client.call_tool("query_dci_teams", {"query": "eq(name,qa)"})
+        result = await client.call_tool("query_dci_teams", {"query": "eq(name,qa)"})
+
+    assert json.loads(result.content[0].text) == {"error": "boom", "message": "x"}
+    assert mock_team_service.query_teams.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_query_dci_teams_api_errors_not_cached(mock_team_service, team_mcp):
+    mock_team_service.query_teams.return_value = {
+        "message": "Unauthorized",
+        "status_code": 401,
+    }
+
+    async with Client(team_mcp) as client:
+        await client.call_tool("query_dci_teams", {"query": "eq(name,qa)"})
+        result = await client.call_tool("query_dci_teams", {"query": "eq(name,qa)"})
+
+    assert json.loads(result.content[0].text)["status_code"] == 401
+    assert mock_team_service.query_teams.call_count == 2